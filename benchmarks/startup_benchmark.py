@@ -0,0 +1,111 @@
+"""Cold-start benchmark for the Picture Management API.
+
+Measures, in fresh interpreters:
+
+* ``import``: time to import ``main`` (application construction);
+* ``ready``: time from launching ``serve.py`` until ``GET /`` answers.
+
+Usage:
+    python benchmarks/startup_benchmark.py --runs 5 --workers 2
+    python benchmarks/startup_benchmark.py --max-ready-ms 1500   # fail if slower
+
+Results are printed as JSON; the exit status is 1 when a threshold is
+exceeded, so the script can guard cold start in CI.
+"""
+
+import os
+import sys
+import json
+import time
+import socket
+import argparse
+import tempfile
+import statistics
+import subprocess
+import urllib.request
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def measure_import(env: dict) -> float:
+    """Return milliseconds needed to import the application."""
+    code = (
+        "import time; start = time.perf_counter(); import main; "
+        "print((time.perf_counter() - start) * 1000)"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", code], cwd=ROOT, env=env,
+        capture_output=True, text=True, check=True
+    )
+    return float(output.stdout.strip())
+
+
+def measure_ready(env: dict, workers: int, timeout: float = 30) -> float:
+    """Return milliseconds from launching the server until it answers."""
+    port = _free_port()
+    url = f"http://127.0.0.1:{port}/"
+    start = time.perf_counter()
+    process = subprocess.Popen(
+        [sys.executable, "serve.py", "--host", "127.0.0.1", "--port", str(port),
+         "--workers", str(workers)],
+        cwd=ROOT, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    try:
+        while time.perf_counter() - start < timeout:
+            try:
+                with urllib.request.urlopen(url, timeout=1) as response:
+                    if response.status == 200:
+                        return (time.perf_counter() - start) * 1000
+            except OSError:
+                time.sleep(0.01)
+        raise TimeoutError(f"server did not answer within {timeout}s")
+    finally:
+        process.terminate()
+        process.wait(timeout=30)
+
+
+def summarize(samples: list) -> dict:
+    return {
+        "min_ms": round(min(samples), 1),
+        "median_ms": round(statistics.median(samples), 1),
+        "max_ms": round(max(samples), 1)
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--skip-ready", action="store_true", help="only measure import time")
+    parser.add_argument("--max-import-ms", type=float)
+    parser.add_argument("--max-ready-ms", type=float)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as upload_dir:
+        env = dict(os.environ, PICTURE_UPLOAD_DIR=upload_dir)
+
+        results = {"workers": args.workers, "runs": args.runs}
+        results["import"] = summarize([measure_import(env) for _ in range(args.runs)])
+        if not args.skip_ready:
+            results["ready"] = summarize(
+                [measure_ready(env, args.workers) for _ in range(args.runs)]
+            )
+
+    print(json.dumps(results, indent=2))
+
+    failed = (
+        (args.max_import_ms is not None and results["import"]["median_ms"] > args.max_import_ms)
+        or (args.max_ready_ms is not None and "ready" in results
+            and results["ready"]["median_ms"] > args.max_ready_ms)
+    )
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -7,8 +7,8 @@ This package contains the core components of the application organized into:
 - utils: Shared utilities and helpers
 """
 
-from .api import upload_router, folder_router, picture_router
-from .services import UploadService, FolderService, PictureService
+from .api import upload_router, folder_router, picture_router, trash_router
+from .services import UploadService, FolderService, PictureService, TranscodeService, IngestionService, TrashService
 from .models import Picture, Folder, UploadResponse
 from .utils import UPLOAD_DIR, ALLOWED_EXTENSIONS
 
@@ -17,11 +17,15 @@ __all__ = [
     "upload_router",
     "folder_router", 
     "picture_router",
+    "trash_router",
     
     # Services
     "UploadService",
     "FolderService",
     "PictureService",
+    "TranscodeService",
+    "IngestionService",
+    "TrashService",
     
     # Models
     "Picture",
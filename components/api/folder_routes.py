@@ -4,12 +4,16 @@ from fastapi import APIRouter
 from typing import Dict, Optional
 
 from ..services.folder_service import FolderService
+from ..services.transcode_service import TranscodeService
+from ..services.ingestion_service import IngestionService
 from ..models.folder import (
     Folder, 
     FolderInfo, 
     FolderRenameRequest, 
     FolderDuplicateRequest
 )
+from ..models.transcode import TranscodeReport
+from ..models.ingestion import IngestionPolicy
 
 router = APIRouter(prefix="", tags=["folders"])
 
@@ -33,6 +37,36 @@ def get_folder_info(folder_name: str):
     return FolderService.get_folder_info(folder_name)
 
 
+@router.get("/folders/{folder_name}/transcode-report", response_model=TranscodeReport)
+def get_transcode_report(folder_name: str):
+    """Report bytes saved by transcoded variants in a folder."""
+    return TranscodeService.folder_report(folder_name)
+
+
+@router.post("/folders/{folder_name}/transcode")
+def transcode_folder(folder_name: str):
+    """Queue transcoding of all pictures in a folder."""
+    return TranscodeService.schedule_folder(folder_name)
+
+
+@router.get("/folders/{folder_name}/ingest-policy", response_model=IngestionPolicy)
+def get_ingest_policy(folder_name: str):
+    """Get the upload-time ingestion policy of a folder."""
+    return IngestionService.get_policy(folder_name)
+
+
+@router.put("/folders/{folder_name}/ingest-policy", response_model=IngestionPolicy)
+def set_ingest_policy(folder_name: str, policy: IngestionPolicy):
+    """Opt a folder into upload-time ingestion processing."""
+    return IngestionService.set_policy(folder_name, policy)
+
+
+@router.delete("/folders/{folder_name}/ingest-policy")
+def delete_ingest_policy(folder_name: str):
+    """Remove the ingestion policy of a folder."""
+    return IngestionService.delete_policy(folder_name)
+
+
 @router.put("/folders/{folder_name}/rename")
 def rename_folder(folder_name: str, request: FolderRenameRequest):
     """Rename a folder."""
@@ -1,7 +1,8 @@
 """Picture API routes."""
 
-from fastapi import APIRouter, File, UploadFile
+from fastapi import APIRouter, File, Header, UploadFile
 from fastapi.responses import FileResponse
+from typing import Optional
 
 from ..services.picture_service import PictureService
 from ..models.picture import PictureInfo
@@ -10,15 +11,20 @@ router = APIRouter(prefix="", tags=["pictures"])
 
 
 @router.get("/pictures/{folder_name}/{filename}")
-def get_picture(folder_name: str, filename: str) -> FileResponse:
-    """Get a picture file for download/viewing."""
-    return PictureService.get_picture_file(folder_name, filename)
+def get_picture(
+    folder_name: str, 
+    filename: str, 
+    original: bool = False,
+    accept: Optional[str] = Header(None)
+) -> FileResponse:
+    """Get a picture file for download/viewing (``?original=true`` skips transcoding)."""
+    return PictureService.get_picture_file(folder_name, filename, accept, original)
 
 
 @router.get("/pictures/{folder_name}/{filename}/info", response_model=PictureInfo)
-def get_picture_info(folder_name: str, filename: str):
+def get_picture_info(folder_name: str, filename: str, checksum: bool = False):
     """Get detailed information about a picture."""
-    return PictureService.get_picture_info(folder_name, filename)
+    return PictureService.get_picture_info(folder_name, filename, checksum)
 
 
 @router.put("/pictures/{folder_name}/{filename}")
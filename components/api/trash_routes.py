@@ -0,0 +1,21 @@
+"""Trash API routes."""
+
+from fastapi import APIRouter
+from typing import Dict, List
+
+from ..services.trash_service import TrashService
+from ..models.trash import TrashItem
+
+router = APIRouter(prefix="", tags=["trash"])
+
+
+@router.get("/trash")
+def list_trash() -> Dict[str, List[TrashItem]]:
+    """List deleted pictures and folders that can still be restored."""
+    return {"items": TrashService.list_trash()}
+
+
+@router.post("/trash/{trash_id}/restore")
+def restore_trash_item(trash_id: str):
+    """Restore a deleted picture or folder."""
+    return TrashService.restore(trash_id)
@@ -0,0 +1,9 @@
+"""ASGI middleware."""
+
+from .rate_limit import RateLimitMiddleware, MemoryBucketStore, SQLiteBucketStore
+
+__all__ = [
+    "RateLimitMiddleware",
+    "MemoryBucketStore",
+    "SQLiteBucketStore"
+]
@@ -0,0 +1,298 @@
+"""Per-client token-bucket rate limiting.
+
+Each client (trusted API key, or client address) has three buckets:
+requests, upload bytes and download bytes. Uploads are charged up front
+from ``Content-Length``; downloads are charged after the response has been
+sent, so a large download puts the bucket into debt and delays the next
+request instead of being cut off mid-stream.
+
+The frontend's static files are not limited, and picture downloads do not
+count as requests (only their bytes count), so a gallery page loading many
+thumbnails at once is not refused.
+"""
+
+import os
+import re
+import math
+import time
+import sqlite3
+import hashlib
+import threading
+from typing import Dict, FrozenSet, List, Optional, Sequence, Tuple
+
+from starlette.concurrency import run_in_threadpool
+from starlette.responses import JSONResponse
+
+from ..utils.constants import (
+    RATE_LIMIT_REQUESTS_PER_SECOND,
+    RATE_LIMIT_UPLOAD_BYTES_PER_SECOND,
+    RATE_LIMIT_DOWNLOAD_BYTES_PER_SECOND,
+    RATE_LIMIT_BURST_SECONDS,
+    RATE_LIMIT_STORE,
+    API_KEY_HEADER,
+    API_KEYS
+)
+
+# Paths passed through without any limit (frontend assets)
+UNLIMITED_PATHS = ("/static/", "/ui")
+
+# Picture downloads, charged for bytes but not counted as requests
+_PICTURE_FILE = re.compile(r"^/pictures/[^/]+/[^/]+$")
+
+
+def _refill(tokens: float, updated: float, now: float, rate: float, capacity: float) -> float:
+    """Return the bucket level after refilling since ``updated``."""
+    return min(capacity, tokens + (now - updated) * rate)
+
+
+def _full_at(tokens: float, now: float, rate: float, capacity: float) -> float:
+    """Return when a bucket will have refilled completely."""
+    return now + max(capacity - tokens, 0.0) / rate
+
+
+def _spend(tokens: float, rate: float, capacity: float, cost: float, force: bool) -> Tuple[float, float]:
+    """Try to spend ``cost`` tokens.
+
+    Returns ``(new_tokens, retry_after)``; ``retry_after`` is 0 when the
+    cost was spent. Costs above the capacity are allowed from a full bucket
+    (leaving it in debt), so large requests are delayed rather than refused
+    forever. With ``force`` the cost is always spent.
+    """
+    needed = min(cost, capacity)
+    if force or tokens >= needed:
+        return tokens - cost, 0.0
+    return tokens, (needed - tokens) / rate
+
+
+# One bucket charge: (key, rate, capacity, cost)
+Charge = Tuple[str, float, float, float]
+
+
+def _charge_all(
+    charges: Sequence[Charge],
+    current: Dict[str, Tuple[float, float]],
+    now: float,
+    force: bool
+) -> Tuple[Dict[str, Tuple[float, float, float]], float]:
+    """Apply charges to the ``current`` ``(tokens, updated)`` of buckets.
+
+    Returns the new ``(tokens, updated, full_at)`` of every bucket and the
+    seconds to wait. Charges are all-or-nothing: callers only store the new
+    levels when the wait is 0.
+    """
+    levels = {}
+    retry_after = 0.0
+    for key, rate, capacity, cost in charges:
+        tokens, updated = current.get(key, (capacity, now))
+        tokens = _refill(tokens, updated, now, rate, capacity)
+        tokens, wait = _spend(tokens, rate, capacity, cost, force)
+        levels[key] = (tokens, now, _full_at(tokens, now, rate, capacity))
+        retry_after = max(retry_after, wait)
+    return levels, retry_after
+
+
+class MemoryBucketStore:
+    """Token buckets kept in process memory."""
+
+    MAX_BUCKETS = 10000
+
+    def __init__(self):
+        # key -> (tokens, updated, full_at)
+        self._buckets: Dict[str, Tuple[float, float, float]] = {}
+        self._lock = threading.Lock()
+
+    def take(self, charges: Sequence[Charge], force: bool = False) -> float:
+        """Charge buckets together, returning seconds to wait (0 if allowed)."""
+        now = time.time()
+        with self._lock:
+            current = {
+                key: self._buckets[key][:2]
+                for key, _, _, _ in charges
+                if key in self._buckets
+            }
+            levels, retry_after = _charge_all(charges, current, now, force)
+            if retry_after == 0:
+                self._buckets.update(levels)
+                if len(self._buckets) > self.MAX_BUCKETS:
+                    self._prune(now)
+        return retry_after
+
+    def _prune(self, now: float) -> None:
+        """Forget buckets that have refilled completely (they restart full)."""
+        self._buckets = {
+            key: bucket
+            for key, bucket in self._buckets.items()
+            if bucket[2] > now
+        }
+
+
+class SQLiteBucketStore:
+    """Token buckets in a local SQLite file, shared by all workers on a host.
+
+    Buckets that have refilled completely are deleted every
+    ``PRUNE_INTERVAL`` seconds; a missing bucket counts as full.
+    """
+
+    PRUNE_INTERVAL = 60.0
+
+    def __init__(self, path: str):
+        self.path = path
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+        self._pruned = 0.0
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database on first use."""
+        if self._conn is None:
+            conn = sqlite3.connect(self.path, timeout=5, isolation_level=None, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=OFF")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS buckets "
+                "(key TEXT PRIMARY KEY, tokens REAL NOT NULL, updated REAL NOT NULL, full_at REAL NOT NULL)"
+            )
+            self._conn = conn
+        return self._conn
+
+    def take(self, charges: Sequence[Charge], force: bool = False) -> float:
+        """Charge buckets in one transaction, returning seconds to wait (0 if allowed).
+
+        This blocks on the database lock; call it off the event loop.
+        """
+        keys = [key for key, _, _, _ in charges]
+        with self._lock:
+            conn = self._connect()
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                now = time.time()
+                rows = conn.execute(
+                    f"SELECT key, tokens, updated FROM buckets WHERE key IN ({','.join('?' * len(keys))})",
+                    keys
+                ).fetchall()
+                current = {key: (tokens, updated) for key, tokens, updated in rows}
+                levels, retry_after = _charge_all(charges, current, now, force)
+                if retry_after == 0:
+                    conn.executemany(
+                        "INSERT OR REPLACE INTO buckets (key, tokens, updated, full_at) VALUES (?, ?, ?, ?)",
+                        [(key,) + level for key, level in levels.items()]
+                    )
+                if now - self._pruned >= self.PRUNE_INTERVAL:
+                    conn.execute("DELETE FROM buckets WHERE full_at <= ?", (now,))
+                    self._pruned = now
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+        return retry_after
+
+
+def create_bucket_store(path: str = RATE_LIMIT_STORE):
+    """Create the configured bucket store."""
+    return SQLiteBucketStore(path) if path else MemoryBucketStore()
+
+
+def client_id(scope, api_keys: FrozenSet[str] = API_KEYS) -> str:
+    """Identify the client of a request by API key or address.
+
+    Only keys in ``api_keys`` are trusted; otherwise a client could dodge
+    its limits by sending a different key with every request.
+    """
+    for name, value in scope.get("headers", []):
+        if name == API_KEY_HEADER.encode() and value.decode("latin-1") in api_keys:
+            return "key:" + hashlib.sha256(value).hexdigest()[:32]
+    client = scope.get("client")
+    return f"addr:{client[0]}" if client else "addr:unknown"
+
+
+class RateLimitMiddleware:
+    """ASGI middleware enforcing per-client request and bandwidth limits."""
+
+    def __init__(
+        self,
+        app,
+        store=None,
+        requests_per_second: float = RATE_LIMIT_REQUESTS_PER_SECOND,
+        upload_bytes_per_second: float = RATE_LIMIT_UPLOAD_BYTES_PER_SECOND,
+        download_bytes_per_second: float = RATE_LIMIT_DOWNLOAD_BYTES_PER_SECOND,
+        burst_seconds: float = RATE_LIMIT_BURST_SECONDS,
+        api_keys: FrozenSet[str] = API_KEYS,
+        unlimited_paths: Tuple[str, ...] = UNLIMITED_PATHS
+    ):
+        self.app = app
+        self.store = store if store is not None else create_bucket_store()
+        self.limits = {
+            "requests": requests_per_second,
+            "upload": upload_bytes_per_second,
+            "download": download_bytes_per_second
+        }
+        self.burst_seconds = burst_seconds
+        self.api_keys = api_keys
+        self.unlimited_paths = unlimited_paths
+
+    async def _take(self, client: str, costs: Dict[str, float], force: bool = False) -> float:
+        """Charge the client's buckets in a worker thread; unlimited kinds always pass."""
+        charges: List[Charge] = []
+        for kind, cost in costs.items():
+            rate = self.limits[kind]
+            if rate > 0:
+                capacity = max(rate * self.burst_seconds, 1.0)
+                charges.append((f"{client}:{kind}", rate, capacity, cost))
+        if not charges:
+            return 0.0
+        return await run_in_threadpool(self.store.take, charges, force)
+
+    async def __call__(self, scope, receive, send):
+        path = scope.get("path", "")
+        if scope["type"] != "http" or path.startswith(self.unlimited_paths):
+            await self.app(scope, receive, send)
+            return
+
+        client = client_id(scope, self.api_keys)
+        picture_get = scope["method"] in ("GET", "HEAD") and _PICTURE_FILE.match(path)
+        content_length = 0
+        for name, value in scope.get("headers", []):
+            if name == b"content-length" and value.isdigit():
+                content_length = int(value)
+
+        retry_after = await self._take(client, {
+            "requests": 0 if picture_get else 1,
+            "upload": content_length,
+            "download": 0
+        })
+        if retry_after > 0:
+            response = JSONResponse(
+                {"detail": "Rate limit exceeded"},
+                status_code=429,
+                headers={"Retry-After": str(math.ceil(retry_after))}
+            )
+            await response(scope, receive, send)
+            return
+
+        received = 0
+        sent = 0
+
+        async def counting_receive():
+            nonlocal received
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+            return message
+
+        async def counting_send(message):
+            nonlocal sent
+            if message["type"] == "http.response.body":
+                sent += len(message.get("body", b""))
+            elif message["type"] == "http.response.pathsend":
+                sent += os.path.getsize(message["path"])
+            await send(message)
+
+        try:
+            await self.app(scope, counting_receive if not content_length else receive, counting_send)
+        finally:
+            costs = {}
+            if not content_length and received:
+                costs["upload"] = received
+            if sent:
+                costs["download"] = sent
+            if costs:
+                await self._take(client, costs, force=True)
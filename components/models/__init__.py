@@ -3,6 +3,9 @@
 from .picture import Picture, PictureInfo
 from .folder import Folder, FolderInfo, FolderCreateRequest, FolderRenameRequest, FolderDuplicateRequest
 from .upload import UploadResponse
+from .transcode import TranscodeEntry, TranscodeReport
+from .ingestion import IngestionPolicy
+from .trash import TrashItem
 
 __all__ = [
     "Picture",
@@ -12,5 +15,9 @@ __all__ = [
     "FolderCreateRequest",
     "FolderRenameRequest",
     "FolderDuplicateRequest",
-    "UploadResponse"
+    "UploadResponse",
+    "TranscodeEntry",
+    "TranscodeReport",
+    "IngestionPolicy",
+    "TrashItem"
 ]
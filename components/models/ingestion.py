@@ -0,0 +1,13 @@
+"""Ingestion policy data models."""
+
+from pydantic import BaseModel, Field
+from typing import Literal, Optional
+
+
+class IngestionPolicy(BaseModel):
+    """Per-folder processing applied to uploaded pictures."""
+    max_pixels: Optional[int] = Field(None, gt=0)
+    recompress_png: bool = False
+    convert_bmp_to: Optional[Literal["png", "webp"]] = None
+    strip_metadata: bool = False
+    keep_original_hours: float = Field(0, ge=0)
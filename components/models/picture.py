@@ -10,6 +10,7 @@ class Picture(BaseModel):
     size: int
     path: str
     folder: str
+    mtime: Optional[float] = None
 
 
 class PictureInfo(BaseModel):
@@ -21,3 +22,4 @@ class PictureInfo(BaseModel):
     created_at: Optional[str] = None
     modified_at: Optional[str] = None
     mime_type: Optional[str] = None
+    sha256: Optional[str] = None
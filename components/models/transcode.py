@@ -0,0 +1,23 @@
+"""Transcode-related data models."""
+
+from pydantic import BaseModel
+from typing import Dict, List, Optional
+
+
+class TranscodeEntry(BaseModel):
+    """Transcoding result for a single picture."""
+    filename: str
+    original_size: int
+    variants: Dict[str, int] = {}
+    best_format: Optional[str] = None
+    bytes_saved: int = 0
+
+
+class TranscodeReport(BaseModel):
+    """Per-folder summary of bytes saved by transcoded variants."""
+    folder: str
+    pictures: List[TranscodeEntry]
+    original_bytes: int
+    served_bytes: int
+    bytes_saved: int
+    pending: int
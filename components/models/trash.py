@@ -0,0 +1,15 @@
+"""Trash-related data models."""
+
+from pydantic import BaseModel
+from typing import Literal, Optional
+
+
+class TrashItem(BaseModel):
+    """A deleted picture or folder that can still be restored."""
+    trash_id: str
+    kind: Literal["picture", "folder"]
+    folder: str
+    filename: Optional[str] = None
+    size: Optional[int] = None
+    deleted_at: str
+    expires_at: str
@@ -10,3 +10,4 @@ class UploadResponse(BaseModel):
     folder: str
     files: List[str]
     total_files: int
+    processing: List[str] = []
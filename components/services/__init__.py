@@ -3,9 +3,16 @@
 from .upload_service import UploadService
 from .folder_service import FolderService
 from .picture_service import PictureService
+from .transcode_service import TranscodeService
+from .ingestion_service import IngestionService
+from .trash_service import TrashService, TrashReclaimer
 
 __all__ = [
     "UploadService",
     "FolderService", 
-    "PictureService"
+    "PictureService",
+    "TranscodeService",
+    "IngestionService",
+    "TrashService",
+    "TrashReclaimer"
 ]
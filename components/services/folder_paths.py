@@ -0,0 +1,22 @@
+"""Folder and picture path resolution shared by the services."""
+
+import os
+from fastapi import HTTPException
+
+from ..utils import UPLOAD_DIR
+
+
+def resolve_folder_path(folder_name: str) -> str:
+    """Resolve a folder path, raising 404 if it is hidden or does not exist."""
+    folder_path = os.path.join(UPLOAD_DIR, folder_name)
+    if folder_name.startswith('.') or not os.path.isdir(folder_path):
+        raise HTTPException(status_code=404, detail="Folder not found")
+    return folder_path
+
+
+def resolve_picture_path(folder_name: str, filename: str) -> str:
+    """Resolve a picture path, raising 404 if it is hidden or not a file."""
+    file_path = os.path.join(UPLOAD_DIR, folder_name, filename)
+    if folder_name.startswith('.') or filename.startswith('.') or not os.path.isfile(file_path):
+        raise HTTPException(status_code=404, detail="Picture not found")
+    return file_path
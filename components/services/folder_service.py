@@ -1,7 +1,8 @@
 """Folder service for managing folders."""
 
 import os
-from typing import Dict, Optional
+import time
+from typing import Any, Dict, Optional
 from fastapi import HTTPException
 
 from ..models.folder import Folder, FolderInfo
@@ -11,10 +12,10 @@ from ..utils import (
     is_image_file, 
     get_file_info, 
     get_folder_info,
-    copy_folder,
-    delete_folder,
+    clone_folder,
     sanitize_folder_name
 )
+from .trash_service import TrashService
 
 
 class FolderService:
@@ -29,6 +30,10 @@ class FolderService:
         folders = {}
         
         for item in os.listdir(UPLOAD_DIR):
+            # Hidden entries (trash, bookkeeping) are not folders
+            if item.startswith('.'):
+                continue
+            
             item_path = os.path.join(UPLOAD_DIR, item)
             
             if os.path.isdir(item_path):
@@ -38,12 +43,13 @@ class FolderService:
                 for file in os.listdir(item_path):
                     file_path = os.path.join(item_path, file)
                     if os.path.isfile(file_path) and is_image_file(file):
-                        size = os.path.getsize(file_path)
+                        stat = os.stat(file_path)
                         pictures.append(Picture(
                             filename=file,
-                            size=size,
+                            size=stat.st_size,
                             path=f"{item}/{file}",
-                            folder=item
+                            folder=item,
+                            mtime=stat.st_mtime
                         ))
                 
                 folders[item] = Folder(
@@ -59,7 +65,7 @@ class FolderService:
         """Get contents of a specific folder."""
         folder_path = os.path.join(UPLOAD_DIR, folder_name)
         
-        if not os.path.exists(folder_path):
+        if folder_name.startswith('.') or not os.path.exists(folder_path):
             raise HTTPException(status_code=404, detail="Folder not found")
         
         if not os.path.isdir(folder_path):
@@ -70,12 +76,13 @@ class FolderService:
         for file in os.listdir(folder_path):
             file_path = os.path.join(folder_path, file)
             if os.path.isfile(file_path) and is_image_file(file):
-                size = os.path.getsize(file_path)
+                stat = os.stat(file_path)
                 pictures.append(Picture(
                     filename=file,
-                    size=size,
+                    size=stat.st_size,
                     path=f"{folder_name}/{file}",
-                    folder=folder_name
+                    folder=folder_name,
+                    mtime=stat.st_mtime
                 ))
         
         return Folder(
@@ -109,7 +116,7 @@ class FolderService:
         """Rename a folder."""
         old_path = os.path.join(UPLOAD_DIR, old_name)
         
-        if not os.path.exists(old_path):
+        if old_name.startswith('.') or not os.path.exists(old_path):
             raise HTTPException(status_code=404, detail="Folder not found")
         
         clean_new_name = sanitize_folder_name(new_name)
@@ -132,11 +139,15 @@ class FolderService:
             )
     
     @staticmethod
-    def duplicate_folder(folder_name: str, new_name: Optional[str] = None) -> Dict[str, str]:
-        """Duplicate a folder."""
+    def duplicate_folder(folder_name: str, new_name: Optional[str] = None) -> Dict[str, Any]:
+        """Duplicate a folder.
+        
+        Uses reflinks, hardlinks or in-kernel copies when the filesystem
+        allows; the response reports the strategy used and the time taken.
+        """
         source_path = os.path.join(UPLOAD_DIR, folder_name)
         
-        if not os.path.exists(source_path):
+        if folder_name.startswith('.') or not os.path.exists(source_path):
             raise HTTPException(status_code=404, detail="Folder not found")
         
         if new_name is None:
@@ -154,17 +165,16 @@ class FolderService:
         dest_path = os.path.join(UPLOAD_DIR, clean_new_name)
         
         try:
-            if copy_folder(source_path, dest_path):
-                return {
-                    "message": "Folder duplicated successfully",
-                    "original_name": folder_name,
-                    "new_name": clean_new_name
-                }
-            else:
-                raise HTTPException(
-                    status_code=500,
-                    detail="Error duplicating folder"
-                )
+            started = time.perf_counter()
+            result = clone_folder(source_path, dest_path)
+            return {
+                "message": "Folder duplicated successfully",
+                "original_name": folder_name,
+                "new_name": clean_new_name,
+                "strategy": result["strategy"],
+                "files": result["files"],
+                "elapsed_ms": round((time.perf_counter() - started) * 1000, 2)
+            }
         except Exception as e:
             raise HTTPException(
                 status_code=500,
@@ -173,23 +183,19 @@ class FolderService:
     
     @staticmethod
     def delete_folder(folder_name: str) -> Dict[str, str]:
-        """Delete a folder and all its contents."""
+        """Move a folder and all its contents to the trash."""
         folder_path = os.path.join(UPLOAD_DIR, folder_name)
         
-        if not os.path.exists(folder_path):
+        if folder_name.startswith('.') or not os.path.exists(folder_path):
             raise HTTPException(status_code=404, detail="Folder not found")
         
         try:
-            if delete_folder(folder_path):
-                return {
-                    "message": "Folder deleted successfully",
-                    "folder_name": folder_name
-                }
-            else:
-                raise HTTPException(
-                    status_code=500,
-                    detail="Error deleting folder"
-                )
+            item = TrashService.trash_folder(folder_name)
+            return {
+                "message": "Folder deleted successfully",
+                "folder_name": folder_name,
+                "trash_id": item.trash_id
+            }
         except Exception as e:
             raise HTTPException(
                 status_code=500,
@@ -0,0 +1,209 @@
+"""Ingestion service for opt-in upload-time picture processing."""
+
+import os
+import json
+import time
+import logging
+from concurrent.futures import Future
+from typing import Dict, Optional
+from fastapi import HTTPException
+
+from ..models.ingestion import IngestionPolicy
+from ..utils import get_process_pool, pillow_available, apply_ingestion_policy
+from ..utils.constants import (
+    INGEST_POLICY_FILE,
+    ORIGINALS_DIR,
+    INGEST_STAGING_DIR,
+    DEFAULT_ORIGINALS_GRACE_HOURS,
+    INGEST_SOURCE_EXTENSIONS
+)
+from .folder_paths import resolve_folder_path
+from .transcode_service import TranscodeService
+
+logger = logging.getLogger(__name__)
+
+
+class IngestionService:
+    """Service for managing and applying per-folder ingestion policies."""
+
+    @staticmethod
+    def get_policy(folder_name: str) -> IngestionPolicy:
+        """Get the ingestion policy of a folder."""
+        folder_path = resolve_folder_path(folder_name)
+        policy = IngestionService.load_policy(folder_path)
+
+        if policy is None:
+            raise HTTPException(status_code=404, detail="No ingestion policy for this folder")
+
+        return policy
+
+    @staticmethod
+    def set_policy(folder_name: str, policy: IngestionPolicy) -> IngestionPolicy:
+        """Create or replace the ingestion policy of a folder."""
+        folder_path = resolve_folder_path(folder_name)
+
+        if not pillow_available():
+            raise HTTPException(
+                status_code=501,
+                detail="Ingestion policies require Pillow to be installed"
+            )
+
+        policy_path = os.path.join(folder_path, INGEST_POLICY_FILE)
+        tmp_path = f"{policy_path}.tmp"
+        try:
+            with open(tmp_path, "w") as f:
+                json.dump(policy.model_dump(), f)
+            os.replace(tmp_path, policy_path)
+        except Exception as e:
+            raise HTTPException(
+                status_code=500,
+                detail=f"Error saving ingestion policy: {str(e)}"
+            )
+
+        return policy
+
+    @staticmethod
+    def delete_policy(folder_name: str) -> Dict[str, str]:
+        """Remove the ingestion policy of a folder."""
+        folder_path = resolve_folder_path(folder_name)
+        policy_path = os.path.join(folder_path, INGEST_POLICY_FILE)
+
+        if not os.path.exists(policy_path):
+            raise HTTPException(status_code=404, detail="No ingestion policy for this folder")
+
+        os.remove(policy_path)
+        return {
+            "message": "Ingestion policy deleted successfully",
+            "folder": folder_name
+        }
+
+    @staticmethod
+    def load_policy(folder_path: str) -> Optional[IngestionPolicy]:
+        """Load a folder's policy, or None if the folder has not opted in."""
+        policy_path = os.path.join(folder_path, INGEST_POLICY_FILE)
+
+        try:
+            with open(policy_path) as f:
+                return IngestionPolicy.model_validate(json.load(f))
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning("Ignoring unreadable ingestion policy %s: %s", policy_path, e)
+            return None
+
+    @staticmethod
+    def applies_to(filename: str) -> bool:
+        """Check if ingestion processing can handle a file."""
+        _, ext = os.path.splitext(filename.lower())
+        return ext in INGEST_SOURCE_EXTENSIONS and pillow_available()
+
+    @staticmethod
+    def target_filename(filename: str, policy: IngestionPolicy) -> str:
+        """Return the name a file will be stored under after ingestion."""
+        name, ext = os.path.splitext(filename)
+        if ext.lower() == '.bmp' and policy.convert_bmp_to:
+            return f"{name}.{policy.convert_bmp_to}"
+        return filename
+
+    @staticmethod
+    def staging_path(file_path: str) -> str:
+        """Return where the raw upload of a picture awaits ingestion."""
+        directory, filename = os.path.split(file_path)
+        return os.path.join(directory, INGEST_STAGING_DIR, filename)
+
+    @staticmethod
+    def schedule(file_path: str, original_name: str, policy: IngestionPolicy) -> None:
+        """Queue ingestion processing of a staged upload in the worker pool.
+
+        The raw upload waits in the folder's staging directory and only
+        appears at ``file_path`` once processed. Transcoded variants are
+        scheduled afterwards, so they are produced from the final picture.
+        """
+        originals_dir = os.path.join(os.path.dirname(file_path), ORIGINALS_DIR)
+        future = get_process_pool().submit(
+            apply_ingestion_policy,
+            IngestionService.staging_path(file_path),
+            file_path,
+            original_name,
+            policy.model_dump(),
+            originals_dir
+        )
+        future.add_done_callback(lambda f: IngestionService._finish(file_path, f))
+
+    @staticmethod
+    def _finish(file_path: str, future: Future) -> None:
+        """Log ingestion failures and queue transcoding of the result.
+
+        When processing failed, the raw upload is moved into place as is.
+        """
+        if future.cancelled():
+            return
+        if future.exception() is not None:
+            logger.warning("Ingestion of %s failed: %s", file_path, future.exception())
+            IngestionService._publish_staged(file_path)
+        TranscodeService.schedule(file_path)
+
+    @staticmethod
+    def _publish_staged(file_path: str) -> None:
+        """Move a leftover raw upload to its final name."""
+        staging_path = IngestionService.staging_path(file_path)
+        try:
+            if os.path.exists(staging_path) and not os.path.exists(file_path):
+                os.replace(staging_path, file_path)
+        except OSError as e:
+            logger.warning("Could not publish staged upload %s: %s", staging_path, e)
+
+    @staticmethod
+    def recover_staged(folder_path: str, max_age_seconds: float = 3600) -> int:
+        """Publish raw uploads left in staging, e.g. by a server restart.
+
+        Returns the number of uploads moved into place.
+        """
+        staging_dir = os.path.join(folder_path, INGEST_STAGING_DIR)
+        if not os.path.isdir(staging_dir):
+            return 0
+
+        cutoff = time.time() - max_age_seconds
+        recovered = 0
+        with os.scandir(staging_dir) as entries:
+            for entry in entries:
+                try:
+                    if not entry.is_file() or entry.stat().st_mtime >= cutoff:
+                        continue
+                    if ".tmp-" in entry.name:
+                        os.remove(entry.path)
+                        continue
+                except OSError:
+                    continue
+                file_path = os.path.join(folder_path, entry.name)
+                IngestionService._publish_staged(file_path)
+                if not os.path.exists(entry.path):
+                    TranscodeService.schedule(file_path)
+                    recovered += 1
+        return recovered
+
+    @staticmethod
+    def purge_expired_originals(folder_path: str) -> int:
+        """Delete kept originals older than the folder's grace period.
+
+        Returns the number of bytes freed.
+        """
+        originals_dir = os.path.join(folder_path, ORIGINALS_DIR)
+        if not os.path.isdir(originals_dir):
+            return 0
+
+        policy = IngestionService.load_policy(folder_path)
+        grace_hours = policy.keep_original_hours if policy else DEFAULT_ORIGINALS_GRACE_HOURS
+        cutoff = time.time() - grace_hours * 3600
+
+        freed = 0
+        with os.scandir(originals_dir) as entries:
+            for entry in entries:
+                try:
+                    stat = entry.stat()
+                    if entry.is_file() and stat.st_mtime < cutoff:
+                        os.remove(entry.path)
+                        freed += stat.st_size
+                except OSError:
+                    continue
+        return freed
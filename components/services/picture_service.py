@@ -2,38 +2,74 @@
 
 import os
 import shutil
-from typing import Dict
+import tempfile
+from typing import Dict, Optional
 from fastapi import UploadFile, HTTPException
 from fastapi.responses import FileResponse
 
 from ..models.picture import Picture, PictureInfo
-from ..utils import UPLOAD_DIR, is_image_file, get_file_info
+from ..utils import is_image_file, get_file_info, get_file_checksum
+from .folder_paths import resolve_picture_path
+from .transcode_service import TranscodeService
+from .upload_service import UploadService
+from .trash_service import TrashService
 
 
 class PictureService:
     """Service for managing individual pictures."""
     
     @staticmethod
-    def get_picture_file(folder_name: str, filename: str) -> FileResponse:
-        """Get a picture file for download/viewing."""
-        file_path = os.path.join(UPLOAD_DIR, folder_name, filename)
+    def get_picture_file(
+        folder_name: str, 
+        filename: str, 
+        accept: Optional[str] = None,
+        original: bool = False
+    ) -> FileResponse:
+        """Get a picture file for download/viewing.
+        
+        When the client accepts a modern format (``Accept`` header) and a
+        smaller transcoded variant is cached, the variant is served instead,
+        unless ``original`` asks for the uploaded file itself.
+        """
+        file_path = resolve_picture_path(folder_name, filename)
+        
+        if original or not TranscodeService.is_transcodable(filename):
+            return FileResponse(
+                file_path,
+                media_type='application/octet-stream',
+                headers={"Content-Disposition": f"attachment; filename={filename}"}
+            )
         
-        if not os.path.exists(file_path):
-            raise HTTPException(status_code=404, detail="Picture not found")
+        variant = TranscodeService.find_variant(file_path, TranscodeService.negotiate(accept))
+        if variant is None:
+            return FileResponse(
+                file_path,
+                media_type='application/octet-stream',
+                headers={
+                    "Content-Disposition": f"attachment; filename={filename}",
+                    "Vary": "Accept"
+                }
+            )
         
+        fmt, variant_path = variant
+        variant_name = f"{os.path.splitext(filename)[0]}.{fmt}"
         return FileResponse(
-            file_path,
-            media_type='application/octet-stream',
-            headers={"Content-Disposition": f"attachment; filename={filename}"}
+            variant_path,
+            media_type=f"image/{fmt}",
+            headers={
+                "Content-Disposition": f"attachment; filename={variant_name}",
+                "Vary": "Accept"
+            }
         )
     
     @staticmethod
-    def get_picture_info(folder_name: str, filename: str) -> PictureInfo:
-        """Get detailed information about a picture."""
-        file_path = os.path.join(UPLOAD_DIR, folder_name, filename)
-        
-        if not os.path.exists(file_path):
-            raise HTTPException(status_code=404, detail="Picture not found")
+    def get_picture_info(
+        folder_name: str, 
+        filename: str, 
+        checksum: bool = False
+    ) -> PictureInfo:
+        """Get detailed information about a picture, optionally with its SHA-256."""
+        file_path = resolve_picture_path(folder_name, filename)
         
         file_info = get_file_info(file_path)
         
@@ -44,7 +80,8 @@ class PictureService:
             folder=folder_name,
             created_at=file_info.get("created_at"),
             modified_at=file_info.get("modified_at"),
-            mime_type=file_info.get("mime_type")
+            mime_type=file_info.get("mime_type"),
+            sha256=get_file_checksum(file_path) if checksum else None
         )
     
     @staticmethod
@@ -53,11 +90,13 @@ class PictureService:
         filename: str, 
         file: UploadFile
     ) -> Dict[str, str]:
-        """Update/replace a picture file."""
-        file_path = os.path.join(UPLOAD_DIR, folder_name, filename)
+        """Update/replace a picture file.
         
-        if not os.path.exists(file_path):
-            raise HTTPException(status_code=404, detail="Picture not found")
+        The new content is written to a temporary file and renamed over the
+        picture, so copies sharing its data (hardlinked duplicates) keep
+        the old content and readers never see a partial file.
+        """
+        file_path = resolve_picture_path(folder_name, filename)
         
         if not file.filename or not is_image_file(file.filename):
             raise HTTPException(
@@ -65,9 +104,27 @@ class PictureService:
                 detail="Invalid image file"
             )
         
+        UploadService.check_folder_quota(
+            os.path.dirname(file_path),
+            UploadService.upload_size(file),
+            replaced=os.path.getsize(file_path)
+        )
+        
         try:
-            with open(file_path, "wb") as buffer:
-                shutil.copyfileobj(file.file, buffer)
+            directory = os.path.dirname(file_path)
+            with tempfile.NamedTemporaryFile(dir=directory, prefix=".", delete=False) as buffer:
+                tmp_path = buffer.name
+                try:
+                    shutil.copyfileobj(file.file, buffer)
+                except Exception:
+                    buffer.close()
+                    os.remove(tmp_path)
+                    raise
+            os.chmod(tmp_path, os.stat(file_path).st_mode & 0o777)
+            os.replace(tmp_path, file_path)
+            
+            TranscodeService.invalidate(file_path)
+            TranscodeService.schedule(file_path)
             
             return {
                 "message": "Picture updated successfully",
@@ -82,18 +139,17 @@ class PictureService:
     
     @staticmethod
     def delete_picture(folder_name: str, filename: str) -> Dict[str, str]:
-        """Delete a specific picture."""
-        file_path = os.path.join(UPLOAD_DIR, folder_name, filename)
-        
-        if not os.path.exists(file_path):
-            raise HTTPException(status_code=404, detail="Picture not found")
+        """Move a specific picture to the trash."""
+        file_path = resolve_picture_path(folder_name, filename)
         
         try:
-            os.remove(file_path)
+            item = TrashService.trash_picture(folder_name, filename)
+            TranscodeService.invalidate(file_path)
             return {
                 "message": "Picture deleted successfully",
                 "filename": filename,
-                "folder": folder_name
+                "folder": folder_name,
+                "trash_id": item.trash_id
             }
         except Exception as e:
             raise HTTPException(
@@ -0,0 +1,241 @@
+"""Transcode service for serving pictures in modern image formats."""
+
+import os
+import logging
+import threading
+from concurrent.futures import Future
+from typing import Dict, List, Optional, Tuple
+
+from ..models.transcode import TranscodeEntry, TranscodeReport
+from ..utils import (
+    is_image_file,
+    get_process_pool,
+    supported_transcode_formats,
+    transcode_image
+)
+from ..utils.constants import (
+    TRANSCODE_DIR,
+    TRANSCODE_FORMATS,
+    TRANSCODE_SOURCE_EXTENSIONS
+)
+from .folder_paths import resolve_folder_path
+
+logger = logging.getLogger(__name__)
+
+_pending: Dict[Tuple[str, str], Future] = {}
+_pending_lock = threading.Lock()
+_formats: Optional[List[str]] = None
+
+
+def _enabled_formats() -> List[str]:
+    """Return encodable formats in server preference order (cached)."""
+    global _formats
+    if _formats is None:
+        supported = supported_transcode_formats()
+        _formats = [fmt for fmt in TRANSCODE_FORMATS if fmt in supported]
+    return _formats
+
+
+class TranscodeService:
+    """Service for producing and serving transcoded picture variants."""
+
+    @staticmethod
+    def is_transcodable(filename: str) -> bool:
+        """Check if a picture is a candidate for transcoding."""
+        _, ext = os.path.splitext(filename.lower())
+        return ext in TRANSCODE_SOURCE_EXTENSIONS and bool(_enabled_formats())
+
+    @staticmethod
+    def variant_path(file_path: str, fmt: str) -> str:
+        """Return where the ``fmt`` variant of a picture is stored."""
+        directory, filename = os.path.split(file_path)
+        return os.path.join(directory, TRANSCODE_DIR, f"{filename}.{fmt}")
+
+    @staticmethod
+    def negotiate(accept: Optional[str]) -> List[str]:
+        """Return the formats acceptable to the client, best first.
+
+        Only explicitly listed media types count: wildcards such as
+        ``*/*`` or ``image/*`` keep the original format.
+        """
+        if not accept:
+            return []
+
+        weights = {}
+        for part in accept.split(","):
+            media_type, *params = [p.strip() for p in part.split(";")]
+            quality = 1.0
+            for param in params:
+                if param.startswith("q="):
+                    try:
+                        quality = float(param[2:])
+                    except ValueError:
+                        quality = 0.0
+            fmt = media_type.lower().replace("image/", "", 1)
+            if media_type.lower().startswith("image/") and fmt in TRANSCODE_FORMATS and quality > 0:
+                weights[fmt] = quality
+
+        preference = list(TRANSCODE_FORMATS)
+        return sorted(
+            (fmt for fmt in weights if fmt in _enabled_formats()),
+            key=lambda fmt: (-weights[fmt], preference.index(fmt))
+        )
+
+    @staticmethod
+    def _variant_stat(file_path: str, fmt: str, source: os.stat_result) -> Optional[os.stat_result]:
+        """Return the stat of a fresh variant, or None if missing or stale."""
+        try:
+            stat = os.stat(TranscodeService.variant_path(file_path, fmt))
+        except OSError:
+            return None
+        if stat.st_mtime_ns != source.st_mtime_ns:
+            return None
+        return stat
+
+    @staticmethod
+    def _failed(file_path: str, fmt: str, source: os.stat_result) -> bool:
+        """Check whether transcoding the current version of a picture failed."""
+        try:
+            stat = os.stat(TranscodeService.variant_path(file_path, fmt) + ".failed")
+        except OSError:
+            return False
+        return stat.st_mtime_ns == source.st_mtime_ns
+
+    @staticmethod
+    def find_variant(file_path: str, formats: List[str]) -> Optional[Tuple[str, str]]:
+        """Pick the cached variant to serve instead of the original.
+
+        Returns ``(format, path)`` for the first fresh variant in ``formats``
+        that is smaller than the original. Missing or stale variants are
+        scheduled for transcoding so later requests can use them, unless
+        transcoding this version of the original already failed.
+        """
+        if not formats or not TranscodeService.is_transcodable(file_path):
+            return None
+
+        source = os.stat(file_path)
+        missing = []
+        for fmt in formats:
+            stat = TranscodeService._variant_stat(file_path, fmt, source)
+            if stat is None:
+                if not TranscodeService._failed(file_path, fmt, source):
+                    missing.append(fmt)
+            elif stat.st_size < source.st_size:
+                return fmt, TranscodeService.variant_path(file_path, fmt)
+
+        for fmt in missing:
+            TranscodeService.schedule(file_path, fmt)
+        return None
+
+    @staticmethod
+    def schedule(file_path: str, fmt: Optional[str] = None) -> None:
+        """Queue background transcoding of a picture.
+
+        Transcodes to ``fmt``, or to every enabled format when omitted.
+        Requests for a variant already in flight are ignored.
+        """
+        if not TranscodeService.is_transcodable(file_path):
+            return
+
+        formats = [fmt] if fmt else _enabled_formats()
+        for target in formats:
+            key = (file_path, target)
+            with _pending_lock:
+                if key in _pending:
+                    continue
+                future = get_process_pool().submit(
+                    transcode_image,
+                    file_path,
+                    TranscodeService.variant_path(file_path, target),
+                    target,
+                    TRANSCODE_FORMATS[target]
+                )
+                _pending[key] = future
+            future.add_done_callback(lambda f, key=key: TranscodeService._finish(key, f))
+
+    @staticmethod
+    def _finish(key: Tuple[str, str], future: Future) -> None:
+        """Forget a finished transcode job and log failures."""
+        with _pending_lock:
+            _pending.pop(key, None)
+        if not future.cancelled() and future.exception() is not None:
+            logger.warning("Transcoding %s to %s failed: %s", key[0], key[1], future.exception())
+
+    @staticmethod
+    def invalidate(file_path: str) -> None:
+        """Remove all cached variants and failure markers of a picture."""
+        for fmt in TRANSCODE_FORMATS:
+            variant = TranscodeService.variant_path(file_path, fmt)
+            for path in (variant, variant + ".failed"):
+                if os.path.exists(path):
+                    os.remove(path)
+
+    @staticmethod
+    def schedule_folder(folder_name: str) -> Dict[str, object]:
+        """Queue transcoding of every picture in a folder lacking a fresh variant.
+
+        Pictures whose current version already failed to transcode are skipped.
+        """
+        folder_path = resolve_folder_path(folder_name)
+
+        queued = 0
+        for file in os.listdir(folder_path):
+            file_path = os.path.join(folder_path, file)
+            if not os.path.isfile(file_path) or not TranscodeService.is_transcodable(file):
+                continue
+            source = os.stat(file_path)
+            for fmt in _enabled_formats():
+                if (TranscodeService._variant_stat(file_path, fmt, source) is None
+                        and not TranscodeService._failed(file_path, fmt, source)):
+                    TranscodeService.schedule(file_path, fmt)
+                    queued += 1
+
+        return {
+            "message": "Transcoding scheduled",
+            "folder": folder_name,
+            "queued": queued
+        }
+
+    @staticmethod
+    def folder_report(folder_name: str) -> TranscodeReport:
+        """Report the bytes saved by serving transcoded variants in a folder."""
+        folder_path = resolve_folder_path(folder_name)
+
+        entries = []
+        for file in sorted(os.listdir(folder_path)):
+            file_path = os.path.join(folder_path, file)
+            if not os.path.isfile(file_path) or not is_image_file(file):
+                continue
+
+            source = os.stat(file_path)
+            variants = {}
+            if TranscodeService.is_transcodable(file):
+                for fmt in _enabled_formats():
+                    stat = TranscodeService._variant_stat(file_path, fmt, source)
+                    if stat is not None:
+                        variants[fmt] = stat.st_size
+
+            best_format = min(variants, key=variants.get, default=None)
+            best_size = variants.get(best_format) if best_format else None
+            saved = source.st_size - best_size if best_size is not None and best_size < source.st_size else 0
+            entries.append(TranscodeEntry(
+                filename=file,
+                original_size=source.st_size,
+                variants=variants,
+                best_format=best_format if saved else None,
+                bytes_saved=saved
+            ))
+
+        original_bytes = sum(entry.original_size for entry in entries)
+        bytes_saved = sum(entry.bytes_saved for entry in entries)
+        with _pending_lock:
+            pending = sum(1 for path, _ in _pending if os.path.dirname(path) == folder_path)
+
+        return TranscodeReport(
+            folder=folder_name,
+            pictures=entries,
+            original_bytes=original_bytes,
+            served_bytes=original_bytes - bytes_saved,
+            bytes_saved=bytes_saved,
+            pending=pending
+        )
@@ -0,0 +1,347 @@
+"""Trash service for soft-deleting and restoring pictures and folders."""
+
+import os
+import json
+import time
+import uuid
+import shutil
+import logging
+import threading
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from fastapi import HTTPException
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - not available on Windows
+    fcntl = None
+
+from ..models.trash import TrashItem
+from ..utils import UPLOAD_DIR
+from ..utils.constants import (
+    TRASH_DIR,
+    TRASH_RETENTION_HOURS,
+    RECLAIM_BYTES_PER_SECOND,
+    RECLAIM_INTERVAL_SECONDS
+)
+from .ingestion_service import IngestionService
+
+logger = logging.getLogger(__name__)
+
+# Each trash entry is a directory named "<deleted-at epoch>-<random>"
+# holding the moved item and a small metadata file.
+_ITEM_NAME = "item"
+_META_FILE = "meta.json"
+_LOCK_FILE = ".reclaimer.lock"
+
+# Entries being reclaimed are renamed to "<prefix><trash id>" first, so they
+# are neither listed nor restorable while their files are deleted.
+_RECLAIMING_PREFIX = ".reclaiming-"
+
+
+def _trash_root() -> str:
+    """Return the trash directory, creating it on first use."""
+    root = os.path.join(UPLOAD_DIR, TRASH_DIR)
+    os.makedirs(root, exist_ok=True)
+    return root
+
+
+def _deleted_at(trash_id: str) -> Optional[float]:
+    """Read the deletion time encoded in a trash id."""
+    try:
+        return float(trash_id.split("-", 1)[0])
+    except ValueError:
+        return None
+
+
+def _expired(trash_id: str, now: Optional[float] = None) -> bool:
+    """Check whether a trash entry is past its retention period."""
+    deleted_at = _deleted_at(trash_id)
+    cutoff = (time.time() if now is None else now) - TRASH_RETENTION_HOURS * 3600
+    return deleted_at is not None and deleted_at < cutoff
+
+
+class TrashService:
+    """Service for moving items to the trash and restoring them."""
+
+    @staticmethod
+    def trash_picture(folder_name: str, filename: str) -> TrashItem:
+        """Move a picture into the trash with a single rename."""
+        file_path = os.path.join(UPLOAD_DIR, folder_name, filename)
+        size = os.path.getsize(file_path)
+        return TrashService._move_to_trash(
+            file_path,
+            {"kind": "picture", "folder": folder_name, "filename": filename, "size": size}
+        )
+
+    @staticmethod
+    def trash_folder(folder_name: str) -> TrashItem:
+        """Move a whole folder into the trash with a single rename."""
+        folder_path = os.path.join(UPLOAD_DIR, folder_name)
+        return TrashService._move_to_trash(
+            folder_path,
+            {"kind": "folder", "folder": folder_name}
+        )
+
+    @staticmethod
+    def _move_to_trash(path: str, meta: Dict) -> TrashItem:
+        """Create a trash entry and rename ``path`` into it."""
+        now = time.time()
+        trash_id = f"{int(now)}-{uuid.uuid4().hex[:12]}"
+        entry_path = os.path.join(_trash_root(), trash_id)
+
+        os.mkdir(entry_path)
+        with open(os.path.join(entry_path, _META_FILE), "w") as f:
+            json.dump(meta, f)
+
+        try:
+            os.rename(path, os.path.join(entry_path, _ITEM_NAME))
+        except Exception:
+            shutil.rmtree(entry_path, ignore_errors=True)
+            raise
+
+        return TrashService._to_item(trash_id, meta)
+
+    @staticmethod
+    def _to_item(trash_id: str, meta: Dict) -> TrashItem:
+        """Build the API model of a trash entry."""
+        deleted_at = _deleted_at(trash_id) or 0
+        return TrashItem(
+            trash_id=trash_id,
+            kind=meta["kind"],
+            folder=meta["folder"],
+            filename=meta.get("filename"),
+            size=meta.get("size"),
+            deleted_at=datetime.fromtimestamp(deleted_at).isoformat(),
+            expires_at=datetime.fromtimestamp(deleted_at + TRASH_RETENTION_HOURS * 3600).isoformat()
+        )
+
+    @staticmethod
+    def _read_meta(trash_id: str) -> Dict:
+        """Load the metadata of a trash entry, raising 404 if it is gone."""
+        entry_path = os.path.join(UPLOAD_DIR, TRASH_DIR, trash_id)
+        if trash_id.startswith(".") or not os.path.exists(os.path.join(entry_path, _ITEM_NAME)):
+            raise HTTPException(status_code=404, detail="Trash item not found")
+
+        with open(os.path.join(entry_path, _META_FILE)) as f:
+            return json.load(f)
+
+    @staticmethod
+    def list_trash() -> List[TrashItem]:
+        """List restorable items, most recently deleted first."""
+        root = os.path.join(UPLOAD_DIR, TRASH_DIR)
+        if not os.path.isdir(root):
+            return []
+
+        items = []
+        now = time.time()
+        for trash_id in sorted(os.listdir(root), reverse=True):
+            if _expired(trash_id, now):
+                continue
+            try:
+                items.append(TrashService._to_item(trash_id, TrashService._read_meta(trash_id)))
+            except (HTTPException, OSError, ValueError, KeyError):
+                continue
+        return items
+
+    @staticmethod
+    def restore(trash_id: str) -> Dict[str, str]:
+        """Move a trashed item back to where it was deleted from."""
+        meta = TrashService._read_meta(trash_id)
+        entry_path = os.path.join(UPLOAD_DIR, TRASH_DIR, trash_id)
+
+        if _expired(trash_id):
+            raise HTTPException(status_code=410, detail="Trash item has expired")
+
+        if meta["kind"] == "picture":
+            folder_path = os.path.join(UPLOAD_DIR, meta["folder"])
+            target = os.path.join(folder_path, meta["filename"])
+        else:
+            folder_path = UPLOAD_DIR
+            target = os.path.join(UPLOAD_DIR, meta["folder"])
+
+        if os.path.exists(target):
+            raise HTTPException(
+                status_code=409,
+                detail=f"Cannot restore: {os.path.relpath(target, UPLOAD_DIR)} already exists"
+            )
+
+        try:
+            os.makedirs(folder_path, exist_ok=True)
+            os.rename(os.path.join(entry_path, _ITEM_NAME), target)
+            shutil.rmtree(entry_path, ignore_errors=True)
+        except FileNotFoundError:
+            # The reclaimer took the entry first
+            raise HTTPException(status_code=404, detail="Trash item not found")
+        except Exception as e:
+            raise HTTPException(
+                status_code=500,
+                detail=f"Error restoring item: {str(e)}"
+            )
+
+        response = {
+            "message": "Item restored successfully",
+            "trash_id": trash_id,
+            "folder": meta["folder"]
+        }
+        if meta.get("filename"):
+            response["filename"] = meta["filename"]
+        return response
+
+    @staticmethod
+    def reclaim_expired(
+        bytes_per_second: int = RECLAIM_BYTES_PER_SECOND,
+        stop: Optional[threading.Event] = None
+    ) -> int:
+        """Permanently delete expired trash entries within an I/O budget.
+
+        Entries are visited oldest first using only their names, and
+        deletion is paced to ``bytes_per_second``. Each entry is first
+        renamed to a hidden name, so a partly deleted entry can never be
+        listed or restored; hidden entries left by an interrupted run are
+        finished first. Returns the bytes freed.
+        """
+        root = os.path.join(UPLOAD_DIR, TRASH_DIR)
+        if not os.path.isdir(root):
+            return 0
+
+        now = time.time()
+        throttle = _Throttle(bytes_per_second)
+        names = sorted(os.listdir(root))
+        reclaiming = [name for name in names if name.startswith(_RECLAIMING_PREFIX)]
+        for trash_id in names:
+            if trash_id.startswith("."):
+                continue
+            if not _expired(trash_id, now) and _deleted_at(trash_id) is not None:
+                break
+            hidden = _RECLAIMING_PREFIX + trash_id
+            try:
+                os.rename(os.path.join(root, trash_id), os.path.join(root, hidden))
+            except OSError:
+                continue
+            reclaiming.append(hidden)
+
+        for name in reclaiming:
+            if stop is not None and stop.is_set():
+                break
+            _remove_tree(os.path.join(root, name), throttle, stop)
+        return throttle.total
+
+
+class _Throttle:
+    """Pace deletions to a byte budget by sleeping when ahead of it."""
+
+    def __init__(self, bytes_per_second: int):
+        self.bytes_per_second = bytes_per_second
+        self.started = time.monotonic()
+        self.total = 0
+
+    def spend(self, size: int, stop: Optional[threading.Event] = None) -> None:
+        """Account for ``size`` freed bytes, sleeping if over budget."""
+        self.total += size
+        if self.bytes_per_second <= 0:
+            return
+        ahead = self.total / self.bytes_per_second - (time.monotonic() - self.started)
+        if ahead > 0:
+            if stop is not None:
+                stop.wait(ahead)
+            else:
+                time.sleep(ahead)
+
+
+def _remove_tree(path: str, throttle: _Throttle, stop: Optional[threading.Event]) -> None:
+    """Delete a directory tree file by file under the throttle."""
+    for root, dirs, files in os.walk(path, topdown=False):
+        for name in files:
+            file_path = os.path.join(root, name)
+            try:
+                size = os.lstat(file_path).st_size
+                os.remove(file_path)
+            except OSError:
+                continue
+            throttle.spend(size, stop)
+            if stop is not None and stop.is_set():
+                return
+        for name in dirs:
+            try:
+                os.rmdir(os.path.join(root, name))
+            except OSError:
+                pass
+    try:
+        os.rmdir(path)
+    except OSError:
+        pass
+
+
+class TrashReclaimer:
+    """Low-priority background thread reclaiming expired trash.
+
+    Each run also purges originals kept by ingestion policies once their
+    grace period is over and publishes stale staged uploads. When several server workers run a reclaimer,
+    a lock file makes sure only one of them reclaims at a time.
+    """
+
+    def __init__(self, interval: float = RECLAIM_INTERVAL_SECONDS):
+        self.interval = interval
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._lock_file = None
+
+    def start(self) -> None:
+        """Start the reclaimer thread."""
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="trash-reclaimer", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Ask the reclaimer to stop and wait for it."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+        if self._lock_file is not None:
+            self._lock_file.close()
+            self._lock_file = None
+
+    def _acquire(self) -> bool:
+        """Try to become the reclaimer for this upload directory."""
+        if fcntl is None:
+            return True
+        if self._lock_file is None:
+            self._lock_file = open(os.path.join(_trash_root(), _LOCK_FILE), "a")
+        try:
+            fcntl.flock(self._lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+            return True
+        except OSError:
+            return False
+
+    def _run(self) -> None:
+        """Reclaim periodically until stopped."""
+        try:
+            # Lower this thread's CPU priority (Linux applies niceness per thread)
+            os.setpriority(os.PRIO_PROCESS, threading.get_native_id(), 19)
+        except (AttributeError, OSError):
+            pass
+
+        while not self._stop.is_set():
+            try:
+                if self._acquire():
+                    self.run_once()
+            except Exception as e:
+                logger.warning("Trash reclamation failed: %s", e)
+            self._stop.wait(self.interval)
+
+    def run_once(self) -> int:
+        """Reclaim expired trash and kept originals, returning bytes freed."""
+        freed = TrashService.reclaim_expired(stop=self._stop)
+
+        if os.path.isdir(UPLOAD_DIR):
+            for name in os.listdir(UPLOAD_DIR):
+                folder_path = os.path.join(UPLOAD_DIR, name)
+                if not name.startswith(".") and os.path.isdir(folder_path):
+                    freed += IngestionService.purge_expired_originals(folder_path)
+                    IngestionService.recover_staged(folder_path)
+        return freed
@@ -6,12 +6,50 @@ from typing import List, Optional
 from fastapi import UploadFile, HTTPException
 
 from ..models.upload import UploadResponse
-from ..utils import create_folder_path, get_unique_filename, is_image_file, UPLOAD_DIR
+from ..utils import (
+    create_folder_path,
+    get_unique_filename,
+    get_folder_usage,
+    is_image_file,
+    sanitize_folder_name,
+    UPLOAD_DIR
+)
+from ..utils.constants import FOLDER_QUOTA_BYTES, INGEST_STAGING_DIR
+from .transcode_service import TranscodeService
+from .ingestion_service import IngestionService
 
 
 class UploadService:
     """Service for handling file uploads."""
     
+    @staticmethod
+    def upload_size(file: UploadFile) -> int:
+        """Get the size of an uploaded file without reading it."""
+        if getattr(file, "size", None) is not None:
+            return file.size
+        
+        position = file.file.tell()
+        file.file.seek(0, os.SEEK_END)
+        size = file.file.tell()
+        file.file.seek(position)
+        return size
+    
+    @staticmethod
+    def check_folder_quota(folder_path: str, incoming: int, replaced: int = 0) -> None:
+        """Reject a write that would take a folder over its storage quota."""
+        if FOLDER_QUOTA_BYTES <= 0:
+            return
+        
+        usage = get_folder_usage(folder_path)
+        if usage - replaced + incoming > FOLDER_QUOTA_BYTES:
+            raise HTTPException(
+                status_code=413,
+                detail=(
+                    f"Folder storage quota exceeded: {usage} of "
+                    f"{FOLDER_QUOTA_BYTES} bytes used, {incoming} bytes uploaded"
+                )
+            )
+    
     @staticmethod
     async def upload_files(
         files: List[UploadFile], 
@@ -21,10 +59,21 @@ class UploadService:
         if not files:
             raise HTTPException(status_code=400, detail="No files provided")
         
+        # Enforce the folder quota before anything is written
+        clean_folder_name = sanitize_folder_name(folder_name)
+        UploadService.check_folder_quota(
+            os.path.join(UPLOAD_DIR, clean_folder_name),
+            sum(UploadService.upload_size(file) for file in files)
+        )
+        
         # Create folder
-        folder_path, clean_folder_name = create_folder_path(folder_name)
+        folder_path, clean_folder_name = create_folder_path(clean_folder_name)
+        policy = IngestionService.load_policy(folder_path)
+        staging_dir = os.path.join(folder_path, INGEST_STAGING_DIR)
         
         uploaded_files = []
+        saved_paths = []
+        ingest_files = {}
         
         for file in files:
             if not file.filename:
@@ -37,29 +86,48 @@ class UploadService:
                     detail=f"File {file.filename} is not a valid image"
                 )
             
-            # Generate unique filename
-            unique_filename = get_unique_filename(folder_path, file.filename)
+            # Generate unique filename (under its post-ingestion name)
+            ingest = policy is not None and IngestionService.applies_to(file.filename)
+            target_filename = file.filename
+            if ingest:
+                target_filename = IngestionService.target_filename(file.filename, policy)
+            unique_filename = get_unique_filename(folder_path, target_filename, staging_dir)
             file_path = os.path.join(folder_path, unique_filename)
             
-            # Save file
+            # Save file (raw uploads awaiting ingestion are staged until processed)
             try:
+                if ingest:
+                    os.makedirs(staging_dir, exist_ok=True)
+                    file_path = IngestionService.staging_path(file_path)
                 with open(file_path, "wb") as buffer:
+                    saved_paths.append(file_path)
                     shutil.copyfileobj(file.file, buffer)
                 uploaded_files.append(unique_filename)
+                if ingest:
+                    ingest_files[unique_filename] = file.filename
             except Exception as e:
                 # Clean up any uploaded files on error
-                for uploaded_file in uploaded_files:
-                    uploaded_path = os.path.join(folder_path, uploaded_file)
-                    if os.path.exists(uploaded_path):
-                        os.remove(uploaded_path)
+                for saved_path in saved_paths:
+                    if os.path.exists(saved_path):
+                        os.remove(saved_path)
                 raise HTTPException(
                     status_code=500, 
                     detail=f"Error saving file {file.filename}: {str(e)}"
                 )
         
+        # Process in the background: apply the folder's ingestion policy
+        # (which transcodes afterwards) or produce modern-format variants
+        for uploaded_file in uploaded_files:
+            uploaded_path = os.path.join(folder_path, uploaded_file)
+            if uploaded_file in ingest_files:
+                IngestionService.schedule(uploaded_path, ingest_files[uploaded_file], policy)
+            else:
+                TranscodeService.schedule(uploaded_path)
+        
         return UploadResponse(
             message="Files uploaded successfully",
             folder=clean_folder_name,
             files=uploaded_files,
-            total_files=len(uploaded_files)
+            total_files=len(uploaded_files),
+            processing=list(ingest_files)
         )
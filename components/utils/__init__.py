@@ -5,13 +5,23 @@ from .file_utils import (
     create_folder_path,
     sanitize_folder_name,
     get_file_info,
+    get_file_checksum,
     get_folder_info,
+    get_folder_usage,
     is_image_file,
     get_mime_type,
-    copy_folder,
-    delete_folder
+    clone_folder
 )
 
+from .image_utils import (
+    pillow_available,
+    supported_transcode_formats,
+    transcode_image,
+    apply_ingestion_policy
+)
+
+from .workers import get_process_pool, shutdown_process_pool
+
 from .constants import UPLOAD_DIR, ALLOWED_EXTENSIONS
 
 __all__ = [
@@ -19,11 +29,18 @@ __all__ = [
     "create_folder_path", 
     "sanitize_folder_name",
     "get_file_info",
+    "get_file_checksum",
     "get_folder_info",
+    "get_folder_usage",
     "is_image_file",
     "get_mime_type",
-    "copy_folder",
-    "delete_folder",
+    "clone_folder",
+    "pillow_available",
+    "supported_transcode_formats",
+    "transcode_image",
+    "apply_ingestion_policy",
+    "get_process_pool",
+    "shutdown_process_pool",
     "UPLOAD_DIR",
     "ALLOWED_EXTENSIONS"
 ]
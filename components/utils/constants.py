@@ -2,14 +2,72 @@
 
 import os
 
-# Upload directory configuration
-UPLOAD_DIR = "uploads"
-
-# Ensure upload directory exists
-os.makedirs(UPLOAD_DIR, exist_ok=True)
+# Upload directory configuration (created on application startup)
+UPLOAD_DIR = os.environ.get("PICTURE_UPLOAD_DIR", "uploads")
 
 # Allowed file extensions for images
 ALLOWED_EXTENSIONS = {'.png', '.jpg', '.jpeg', '.gif', '.bmp', '.webp', '.svg'}
 
 # Maximum file size (in bytes) - 10MB
 MAX_FILE_SIZE = 10 * 1024 * 1024
+
+# Hidden directory (inside each folder) holding transcoded variants
+TRANSCODE_DIR = ".transcoded"
+
+# Transcode target formats in server preference order, with encoder quality
+TRANSCODE_FORMATS = {"avif": 50, "webp": 80}
+
+# Source extensions worth transcoding (animated and vector formats are served as-is)
+TRANSCODE_SOURCE_EXTENSIONS = {'.png', '.jpg', '.jpeg', '.bmp'}
+
+# Number of processes in the background image worker pool
+WORKER_PROCESSES = int(os.environ.get("PICTURE_WORKER_PROCESSES", "2"))
+
+# Per-folder ingestion policy file (opt-in upload-time processing)
+INGEST_POLICY_FILE = ".ingest_policy.json"
+
+# Hidden directory (inside each folder) keeping originals replaced by ingestion
+ORIGINALS_DIR = ".originals"
+
+# Hidden directory (inside each folder) holding raw uploads awaiting ingestion
+INGEST_STAGING_DIR = ".ingest"
+
+# Grace period for kept originals when a folder has no policy any more
+DEFAULT_ORIGINALS_GRACE_HOURS = 24.0
+
+# Extensions the ingestion policy can process
+INGEST_SOURCE_EXTENSIONS = {'.png', '.jpg', '.jpeg', '.bmp', '.webp'}
+
+# Per-client rate limits (0 disables a limit, the default: limiting is opt-in);
+# buckets hold this many seconds of burst
+RATE_LIMIT_REQUESTS_PER_SECOND = float(os.environ.get("PICTURE_RATE_LIMIT_RPS", "0"))
+RATE_LIMIT_UPLOAD_BYTES_PER_SECOND = float(os.environ.get("PICTURE_RATE_LIMIT_UPLOAD_BPS", "0"))
+RATE_LIMIT_DOWNLOAD_BYTES_PER_SECOND = float(os.environ.get("PICTURE_RATE_LIMIT_DOWNLOAD_BPS", "0"))
+RATE_LIMIT_BURST_SECONDS = float(os.environ.get("PICTURE_RATE_LIMIT_BURST_SECONDS", "2"))
+
+# SQLite file sharing rate limit state between workers (empty: per-process memory)
+RATE_LIMIT_STORE = os.environ.get("PICTURE_RATE_LIMIT_STORE", "")
+
+# Header identifying API clients (falls back to the client address)
+API_KEY_HEADER = "x-api-key"
+
+# API keys trusted to identify a client (comma separated); other keys are ignored
+API_KEYS = frozenset(key.strip() for key in os.environ.get("PICTURE_API_KEYS", "").split(",") if key.strip())
+
+# Storage quota per folder in bytes (0: unlimited)
+FOLDER_QUOTA_BYTES = int(os.environ.get("PICTURE_FOLDER_QUOTA_BYTES", "0"))
+
+# Trash area (inside UPLOAD_DIR) where deleted pictures and folders are moved
+TRASH_DIR = ".trash"
+
+# How long trashed items can be restored before they are reclaimed
+TRASH_RETENTION_HOURS = float(os.environ.get("PICTURE_TRASH_RETENTION_HOURS", "72"))
+
+# Disk bandwidth the background reclaimer may spend deleting (bytes per second)
+RECLAIM_BYTES_PER_SECOND = int(os.environ.get("PICTURE_RECLAIM_BPS", str(20 * 1024 * 1024)))
+
+# Seconds between background reclaimer runs
+RECLAIM_INTERVAL_SECONDS = float(os.environ.get("PICTURE_RECLAIM_INTERVAL", "300"))
+
+# Threads used to copy files when duplicating a folder needs real copies
+COPY_THREADS = int(os.environ.get("PICTURE_COPY_THREADS", "8"))
@@ -2,17 +2,41 @@
 
 import os
 import shutil
+import hashlib
 import mimetypes
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Optional, Dict, Any
-from .constants import UPLOAD_DIR, ALLOWED_EXTENSIONS
+from typing import Optional, Dict, Any, Callable, List, Tuple
+from .constants import (
+    UPLOAD_DIR,
+    ALLOWED_EXTENSIONS,
+    COPY_THREADS,
+    ORIGINALS_DIR,
+    INGEST_STAGING_DIR,
+    INGEST_POLICY_FILE,
+    TRANSCODE_DIR
+)
 
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - not available on Windows
+    fcntl = None
 
-def get_unique_filename(directory: str, filename: str) -> str:
-    """Generate a unique filename by adding numbers if file exists."""
-    base_path = os.path.join(directory, filename)
+# ioctl request cloning a whole file (Linux FICLONE, supported by btrfs and XFS)
+FICLONE = 0x40049409
+
+
+def get_unique_filename(directory: str, filename: str, *other_dirs: str) -> str:
+    """Generate a unique filename by adding numbers if file exists.
+    
+    The name is also kept free in any ``other_dirs`` given.
+    """
+    directories = (directory,) + other_dirs
+    
+    def taken(candidate: str) -> bool:
+        return any(os.path.exists(os.path.join(d, candidate)) for d in directories)
     
-    if not os.path.exists(base_path):
+    if not taken(filename):
         return filename
     
     # Split filename and extension
@@ -22,9 +46,8 @@ def get_unique_filename(directory: str, filename: str) -> str:
     # Keep incrementing until we find a unique name
     while True:
         new_filename = f"{name}_{counter}{ext}"
-        new_path = os.path.join(directory, new_filename)
         
-        if not os.path.exists(new_path):
+        if not taken(new_filename):
             return new_filename
         
         counter += 1
@@ -78,6 +101,15 @@ def get_file_info(file_path: str) -> Dict[str, Any]:
     }
 
 
+def get_file_checksum(file_path: str) -> str:
+    """Compute the SHA-256 hex digest of a file."""
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
 def get_folder_info(folder_path: str) -> Dict[str, Any]:
     """Get detailed information about a folder."""
     if not os.path.exists(folder_path) or not os.path.isdir(folder_path):
@@ -87,6 +119,8 @@ def get_folder_info(folder_path: str) -> Dict[str, Any]:
     file_count = 0
     
     for root, dirs, files in os.walk(folder_path):
+        # Skip hidden bookkeeping directories such as cached transcodes
+        dirs[:] = [d for d in dirs if not d.startswith('.')]
         for file in files:
             file_path = os.path.join(root, file)
             if os.path.exists(file_path):
@@ -103,19 +137,125 @@ def get_folder_info(folder_path: str) -> Dict[str, Any]:
     }
 
 
-def copy_folder(src_path: str, dst_path: str) -> bool:
-    """Copy a folder and all its contents."""
+def get_folder_usage(folder_path: str) -> int:
+    """Get the bytes used by the files stored for a folder.
+    
+    Counts the files directly inside the folder plus kept originals and
+    uploads awaiting ingestion, one ``scandir`` each, which keeps quota
+    checks cheap. Transcoded variants are a cache and are not counted.
+    """
+    total = 0
+    for path in (folder_path, os.path.join(folder_path, ORIGINALS_DIR), os.path.join(folder_path, INGEST_STAGING_DIR)):
+        try:
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    if entry.is_file(follow_symlinks=False):
+                        total += entry.stat(follow_symlinks=False).st_size
+        except FileNotFoundError:
+            continue
+    return total
+
+
+def _reflink_file(src: str, dst: str) -> None:
+    """Clone a file sharing its data blocks (copy-on-write)."""
+    if fcntl is None:
+        raise OSError("reflinks are not supported on this platform")
+    
     try:
-        shutil.copytree(src_path, dst_path)
-        return True
-    except Exception:
-        return False
+        with open(src, "rb") as src_file, open(dst, "wb") as dst_file:
+            fcntl.ioctl(dst_file.fileno(), FICLONE, src_file.fileno())
+    except OSError:
+        if os.path.exists(dst):
+            os.remove(dst)
+        raise
+    shutil.copystat(src, dst)
+
+
+def _hardlink_file(src: str, dst: str) -> None:
+    """Link a file into the copy.
+    
+    Safe because pictures are only ever replaced by renaming a new file
+    over them, never rewritten in place, which breaks the link.
+    """
+    os.link(src, dst)
 
 
-def delete_folder(folder_path: str) -> bool:
-    """Delete a folder and all its contents."""
+def _copy_file_range(src: str, dst: str) -> None:
+    """Copy a file inside the kernel with ``copy_file_range``."""
+    if not hasattr(os, "copy_file_range"):
+        raise OSError("copy_file_range is not supported on this platform")
+    
     try:
-        shutil.rmtree(folder_path)
-        return True
-    except Exception:
+        with open(src, "rb") as src_file, open(dst, "wb") as dst_file:
+            remaining = os.fstat(src_file.fileno()).st_size
+            while remaining > 0:
+                copied = os.copy_file_range(src_file.fileno(), dst_file.fileno(), remaining)
+                if copied == 0:
+                    break
+                remaining -= copied
+    except OSError:
+        if os.path.exists(dst):
+            os.remove(dst)
+        raise
+    shutil.copystat(src, dst)
+
+
+# Duplication strategies, cheapest first
+CLONE_STRATEGIES: List[Tuple[str, Callable[[str, str], None]]] = [
+    ("reflink", _reflink_file),
+    ("hardlink", _hardlink_file),
+    ("copy_file_range", _copy_file_range),
+    ("copy", shutil.copy2)
+]
+
+
+def _is_clonable(name: str) -> bool:
+    """Check if a file belongs in a folder duplicate (not a temporary file)."""
+    if name.startswith('.') and name != INGEST_POLICY_FILE:
         return False
+    return ".tmp-" not in name
+
+
+def clone_folder(src_path: str, dst_path: str) -> Dict[str, Any]:
+    """Duplicate a folder using the cheapest strategy the filesystem allows.
+    
+    Strategies are probed in ``CLONE_STRATEGIES`` order on the first file;
+    the first one that works is used for all remaining files, in parallel.
+    Files the chosen strategy fails on are copied normally. Uploads still
+    being ingested, temporary files and the rebuildable transcoded variant
+    cache are not copied.
+    """
+    pairs = []
+    for root, dirs, files in os.walk(src_path):
+        if root == src_path:
+            dirs[:] = [d for d in dirs if d not in (INGEST_STAGING_DIR, TRANSCODE_DIR)]
+        target_root = os.path.join(dst_path, os.path.relpath(root, src_path))
+        os.makedirs(target_root, exist_ok=True)
+        shutil.copystat(root, target_root)
+        for file in files:
+            if _is_clonable(file):
+                pairs.append((os.path.join(root, file), os.path.join(target_root, file)))
+    
+    if not pairs:
+        return {"strategy": "copy", "files": 0}
+    
+    first_src, first_dst = pairs[0]
+    for strategy, clone_file in CLONE_STRATEGIES:
+        try:
+            clone_file(first_src, first_dst)
+            break
+        except OSError as e:
+            error = e
+    else:
+        raise error
+    
+    def clone_one(pair: Tuple[str, str]) -> None:
+        try:
+            clone_file(*pair)
+        except OSError:
+            shutil.copy2(*pair)
+    
+    with ThreadPoolExecutor(max_workers=COPY_THREADS) as executor:
+        list(executor.map(clone_one, pairs[1:]))
+    
+    return {"strategy": strategy, "files": len(pairs)}
@@ -0,0 +1,233 @@
+"""Image processing helpers executed in the background worker pool.
+
+Pillow is an optional dependency: without it every helper reports that
+no image processing is available and pictures are served unchanged.
+It is imported on first use so that it does not slow down startup.
+"""
+
+import os
+import math
+import importlib.util
+from typing import Any, Dict, Set
+
+from .file_utils import get_unique_filename
+
+
+def pillow_available() -> bool:
+    """Check whether Pillow is installed (without importing it)."""
+    return importlib.util.find_spec("PIL") is not None
+
+
+def supported_transcode_formats() -> Set[str]:
+    """Return the transcode formats the installed Pillow can encode."""
+    if not pillow_available():
+        return set()
+
+    from PIL import features
+
+    supported = set()
+    if features.check("webp"):
+        supported.add("webp")
+    try:
+        if features.check("avif"):
+            supported.add("avif")
+    except ValueError:
+        # Pillow releases older than 11.2 do not know about AVIF
+        pass
+    return supported
+
+
+def transcode_image(src_path: str, dst_path: str, fmt: str, quality: int) -> Dict[str, int]:
+    """Transcode an image to ``fmt`` and store it at ``dst_path``.
+
+    The variant is written atomically and stamped with the source mtime, so
+    a variant is fresh exactly when both mtimes match. When the source cannot
+    be transcoded, an empty ``<dst_path>.failed`` marker is stamped the same
+    way so the attempt is not repeated until the source changes.
+    """
+    from PIL import Image, ImageOps
+
+    failed_path = f"{dst_path}.failed"
+    with open(src_path, "rb") as fh:
+        stat = os.fstat(fh.fileno())
+        os.makedirs(os.path.dirname(dst_path), exist_ok=True)
+        tmp_path = f"{dst_path}.tmp-{os.getpid()}"
+        try:
+            image = Image.open(fh)
+            icc_profile = image.info.get("icc_profile")
+            image = ImageOps.exif_transpose(image)
+
+            if image.mode not in ("RGB", "RGBA"):
+                has_alpha = image.mode in ("LA", "PA") or "transparency" in image.info
+                image = image.convert("RGBA" if has_alpha else "RGB")
+
+            # Keep the colour profile so wide-gamut pictures keep their colours
+            save_args = {"icc_profile": icc_profile} if icc_profile else {}
+            image.save(tmp_path, format=fmt.upper(), quality=quality, **save_args)
+            os.utime(tmp_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+            os.replace(tmp_path, dst_path)
+        except Exception:
+            with open(failed_path, "wb"):
+                pass
+            os.utime(failed_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+            raise
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    if os.path.exists(failed_path):
+        os.remove(failed_path)
+
+    return {
+        "original_size": stat.st_size,
+        "size": os.path.getsize(dst_path)
+    }
+
+
+_SAVE_FORMATS = {
+    '.png': 'PNG',
+    '.jpg': 'JPEG',
+    '.jpeg': 'JPEG',
+    '.webp': 'WEBP',
+    '.bmp': 'BMP'
+}
+
+
+def apply_ingestion_policy(
+    staging_path: str,
+    final_path: str,
+    original_name: str,
+    policy: Dict[str, Any],
+    originals_dir: str
+) -> Dict[str, Any]:
+    """Apply a folder ingestion policy to a staged upload.
+
+    ``staging_path`` holds the raw upload; the processed result (or the
+    upload itself when nothing needs rewriting) is renamed to ``final_path``
+    atomically. The output format follows the extension of ``final_path``.
+    When ``keep_original_hours`` is set, the raw upload is moved to
+    ``originals_dir`` under ``original_name``.
+    """
+    from PIL import Image, ImageOps
+
+    _, ext = os.path.splitext(final_path.lower())
+    target_format = _SAVE_FORMATS[ext]
+
+    tmp_path = f"{staging_path}.tmp-{os.getpid()}"
+    try:
+        with open(staging_path, "rb") as fh:
+            stat = os.fstat(fh.fileno())
+            lossy = _is_lossy(fh)
+            image = Image.open(fh)
+            image = _process_upload(image, target_format, policy, tmp_path, lossy)
+
+        if image is None:
+            os.replace(staging_path, final_path)
+            return {"changed": False, "size": stat.st_size}
+
+        os.replace(tmp_path, final_path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+    if policy.get("keep_original_hours"):
+        os.makedirs(originals_dir, exist_ok=True)
+        os.replace(staging_path, os.path.join(originals_dir, get_unique_filename(originals_dir, original_name)))
+    else:
+        os.remove(staging_path)
+
+    return {
+        "changed": True,
+        "original_size": stat.st_size,
+        "size": os.path.getsize(final_path),
+        "width": image.width,
+        "height": image.height
+    }
+
+
+def _is_lossy(fh) -> bool:
+    """Check whether an open image file is lossily compressed (JPEG or lossy WebP).
+
+    WebP files are told apart by their first image chunk: ``VP8 `` is lossy,
+    ``VP8L`` lossless. The file position is restored afterwards.
+    """
+    position = fh.tell()
+    try:
+        header = fh.read(12)
+        if header[:3] == b"\xff\xd8\xff":
+            return True
+        if header[:4] != b"RIFF" or header[8:12] != b"WEBP":
+            return False
+        while True:
+            chunk = fh.read(8)
+            if len(chunk) < 8:
+                return False
+            if chunk[:4] in (b"VP8 ", b"VP8L"):
+                return chunk[:4] == b"VP8 "
+            size = int.from_bytes(chunk[4:], "little")
+            fh.seek(size + (size & 1), os.SEEK_CUR)
+    finally:
+        fh.seek(position)
+
+
+def _process_upload(image, target_format: str, policy: Dict[str, Any], tmp_path: str, lossy: bool):
+    """Save the processed ``image`` to ``tmp_path``.
+
+    ``lossy`` tells whether the upload was lossily compressed; lossless
+    sources stay lossless. Returns the processed image, or None when the
+    upload can be kept as is.
+    """
+    from PIL import Image, ImageOps
+
+    source_format = image.format
+
+    if getattr(image, "is_animated", False):
+        return None
+
+    has_metadata = any(key in image.info for key in ("exif", "icc_profile", "xmp"))
+    exif = image.info.get("exif")
+    icc_profile = image.info.get("icc_profile")
+
+    resized = False
+    max_pixels = policy.get("max_pixels")
+    if max_pixels and image.width * image.height > max_pixels:
+        scale = math.sqrt(max_pixels / (image.width * image.height))
+        size = (max(1, int(image.width * scale)), max(1, int(image.height * scale)))
+        if policy.get("strip_metadata"):
+            image = ImageOps.exif_transpose(image)
+        image = image.resize(size, Image.LANCZOS)
+        resized = True
+
+    rewrite = (
+        resized
+        or source_format != target_format
+        or (target_format == 'PNG' and policy.get("recompress_png"))
+        or (policy.get("strip_metadata") and has_metadata)
+    )
+    if not rewrite:
+        return None
+
+    if policy.get("strip_metadata") and not resized:
+        # In place, so a JPEG keeps its quantization tables for quality="keep"
+        ImageOps.exif_transpose(image, in_place=True)
+
+    save_args: Dict[str, Any] = {}
+    if not policy.get("strip_metadata"):
+        if exif:
+            save_args["exif"] = exif
+        if icc_profile:
+            save_args["icc_profile"] = icc_profile
+
+    if target_format == 'PNG':
+        save_args["optimize"] = True
+    elif target_format == 'WEBP':
+        save_args["lossless"] = not lossy
+        save_args["quality"] = 100 if save_args["lossless"] else 90
+    elif target_format == 'JPEG':
+        if image.mode not in ("RGB", "L", "CMYK"):
+            image = image.convert("RGB")
+        keep = not resized and getattr(image, "format", None) == 'JPEG'
+        save_args["quality"] = "keep" if keep else 90
+
+    image.save(tmp_path, format=target_format, **save_args)
+    return image
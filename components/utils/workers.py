@@ -0,0 +1,43 @@
+"""Shared worker pool for background image processing."""
+
+import threading
+from typing import Optional, TYPE_CHECKING
+
+from .constants import WORKER_PROCESSES
+
+if TYPE_CHECKING:
+    from concurrent.futures import ProcessPoolExecutor
+
+_pool: Optional["ProcessPoolExecutor"] = None
+_pool_lock = threading.Lock()
+
+
+def get_process_pool() -> "ProcessPoolExecutor":
+    """Return the shared process pool, creating it on first use.
+    
+    Creating it lazily keeps startup fast and ensures pre-forked server
+    workers each get their own pool instead of inheriting the parent's.
+    Pool processes are started from a fork server (or spawned where that is
+    unavailable) because forking the multi-threaded server can deadlock.
+    """
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                import multiprocessing
+                from concurrent.futures import ProcessPoolExecutor
+                method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+                _pool = ProcessPoolExecutor(
+                    max_workers=WORKER_PROCESSES,
+                    mp_context=multiprocessing.get_context(method)
+                )
+    return _pool
+
+
+def shutdown_process_pool() -> None:
+    """Shut down the shared process pool if it was started."""
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown(wait=False, cancel_futures=True)
+            _pool = None
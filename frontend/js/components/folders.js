@@ -233,7 +233,7 @@ class FoldersManager {
             // Download each picture
             for (const picture of folderData.pictures) {
                 const link = document.createElement('a');
-                link.href = `/pictures/${picture.path}`;
+                link.href = `/pictures/${picture.path}?original=true`;
                 link.download = picture.filename;
                 document.body.appendChild(link);
                 link.click();
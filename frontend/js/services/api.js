@@ -210,7 +210,7 @@ class ApiService {
      */
     async downloadPicture(folderName, filename) {
         try {
-            const url = this.getPictureUrl(folderName, filename);
+            const url = `${this.getPictureUrl(folderName, filename)}?original=true`;
             const response = await fetch(url);
             
             if (!response.ok) {
@@ -1,11 +1,38 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.staticfiles import StaticFiles
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import FileResponse
-from components.api import upload_router, folder_router, picture_router
+from components.api import upload_router, folder_router, picture_router, trash_router
+from components.middleware import RateLimitMiddleware
+from components.services import TrashReclaimer
+from components.utils import UPLOAD_DIR, shutdown_process_pool
 import os
 
-app = FastAPI(title="Picture Management API", version="1.0.0")
+# Frontend location, independent of the working directory the server runs in
+FRONTEND_DIR = os.environ.get(
+    "PICTURE_FRONTEND_DIR",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "frontend")
+)
+
+# Background reclamation of expired trash
+reclaimer = TrashReclaimer()
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Run the background trash reclaimer and image worker pool with the app."""
+    os.makedirs(UPLOAD_DIR, exist_ok=True)
+    reclaimer.start()
+    try:
+        yield
+    finally:
+        reclaimer.stop()
+        shutdown_process_pool()
+
+app = FastAPI(title="Picture Management API", version="1.0.0", lifespan=lifespan)
+
+# Add per-client rate limiting (inside CORS so 429 responses keep CORS headers)
+app.add_middleware(RateLimitMiddleware)
 
 # Add CORS middleware
 app.add_middleware(
@@ -16,13 +43,14 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Mount static files for frontend
-app.mount("/static", StaticFiles(directory="frontend"), name="static")
+# Mount static files for frontend (the directory is checked on first request)
+app.mount("/static", StaticFiles(directory=FRONTEND_DIR, check_dir=False), name="static")
 
 # Include API routers
 app.include_router(upload_router)
 app.include_router(folder_router)
 app.include_router(picture_router)
+app.include_router(trash_router)
 
 @app.get("/")
 def read_root():
@@ -31,4 +59,4 @@ def read_root():
 @app.get("/ui")
 def serve_ui():
     """Serve the frontend UI"""
-    return FileResponse("frontend/index.html")
+    return FileResponse(os.path.join(FRONTEND_DIR, "index.html"))
@@ -1,85 +1,15 @@
 #!/bin/bash
 
-URL="http://localhost:8000/pictures"
+# Picture Management CLI - thin wrapper around the Python client.
+# Run "./picture_cli.sh --help" for all commands, for example:
+#   ./picture_cli.sh list [folder]
+#   ./picture_cli.sh get folder/filename.jpg
+#   ./picture_cli.sh post /path/to/file1.jpg [file2.jpg ...] --folder my_photos
+#   ./picture_cli.sh push ./local_dir my_photos -j 16
+#   ./picture_cli.sh pull my_photos ./local_dir -j 16
+# Set PICTURE_API_URL to target another server (default http://localhost:8000).
 
-case "$1" in
-  get)
-    # Usage: ./picture_cli.sh get filename
-    if [ -z "$2" ]; then 
-      echo "Error: Missing filename"
-      echo "Usage: $0 get filename"
-      exit 1
-    fi
-    echo "Downloading $2..."
-    curl -s "$URL/$2" --output "$2"
-    if [ $? -eq 0 ]; then
-      echo "File downloaded successfully: $2"
-    else
-      echo "Error: Failed to download $2"
-    fi
-    ;;
-  post)
-    # Usage: ./picture_cli.sh post /path/to/file1.jpg [/path/to/file2.jpg ...]
-    if [ -z "$2" ]; then 
-      echo "Error: Missing file(s)"
-      echo "Usage: $0 post /path/to/file1.jpg [/path/to/file2.jpg ...]"
-      exit 1
-    fi
-    shift
-    
-    FORM_ARGS=()
-    for file in "$@"; do
-      if [ ! -f "$file" ]; then
-        echo "Error: File not found: $file"
-        exit 1
-      fi
-      FORM_ARGS+=(-F "files=@$file")
-    done
-    
-    echo "Uploading files... (duplicate names will be numbered automatically)"
-    curl "${FORM_ARGS[@]}" "$URL"
-    echo
-    ;;
-  put)
-    # Usage: ./picture_cli.sh put filename /path/to/newfile.jpg
-    if [ -z "$2" ] || [ -z "$3" ]; then 
-      echo "Error: Missing arguments"
-      echo "Usage: $0 put filename /path/to/newfile.jpg"
-      exit 1
-    fi
-    if [ ! -f "$3" ]; then
-      echo "Error: File not found: $3"
-      exit 1
-    fi
-    echo "Updating $2..."
-    curl -X PUT -F "file=@$3" "$URL/$2"
-    echo
-    ;;
-  delete)
-    # Usage: ./picture_cli.sh delete filename
-    if [ -z "$2" ]; then 
-      echo "Error: Missing filename"
-      echo "Usage: $0 delete filename"
-      exit 1
-    fi
-    echo "Deleting $2..."
-    curl -X DELETE -H "Content-Type: application/json" -d "[\"$2\"]" "$URL"
-    echo
-    ;;
-  list)
-    # Usage: ./picture_cli.sh list
-    echo "Listing all pictures..."
-    curl -s "$URL" | python3 -m json.tool
-    ;;
-  *)
-    echo "Picture Management CLI"
-    echo "Usage:"
-    echo "  $0 get filename                              - Download a picture"
-    echo "  $0 post /path/to/file1.jpg [file2.jpg ...]  - Upload picture(s)"
-    echo "  $0 put filename /path/to/newfile.jpg         - Update a picture"
-    echo "  $0 delete filename                           - Delete a picture"
-    echo "  $0 list                                      - List all pictures"
-    echo ""
-    echo "Note: Duplicate filenames will be automatically numbered (e.g., image_1.jpg)"
-    ;;
-esac
\ No newline at end of file
+SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
+export PYTHONPATH="$SCRIPT_DIR${PYTHONPATH:+:$PYTHONPATH}"
+
+exec python3 -m picture_client "$@"
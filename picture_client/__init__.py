@@ -0,0 +1,15 @@
+"""Python client for the Picture Management API.
+
+Only depends on ``requests``; it does not import the server components.
+"""
+
+from .client import PictureClient, PictureAPIError
+from .sync import SyncResult, push, pull
+
+__all__ = [
+    "PictureClient",
+    "PictureAPIError",
+    "SyncResult",
+    "push",
+    "pull"
+]
@@ -0,0 +1,7 @@
+"""Allow ``python -m picture_client``."""
+
+import sys
+
+from .cli import main
+
+sys.exit(main())
@@ -0,0 +1,140 @@
+"""Command-line interface for the Picture Management API."""
+
+import os
+import sys
+import json
+import argparse
+from typing import List, Optional
+
+from .client import PictureAPIError, PictureClient
+from .sync import SyncResult, push, pull
+
+
+def _split_picture(value: str):
+    """Parse ``folder/filename`` arguments."""
+    folder, sep, filename = value.partition("/")
+    if not sep or not folder or not filename:
+        raise argparse.ArgumentTypeError("expected folder/filename")
+    return folder, filename
+
+
+def _print_json(data) -> None:
+    print(json.dumps(data, indent=2))
+
+
+def _report(result: SyncResult, dry_run: bool) -> int:
+    verb = "would transfer" if dry_run else "transferred"
+    print(
+        f"{len(result.transferred)} {verb}, {len(result.skipped)} unchanged, "
+        f"{len(result.failed)} failed ({result.bytes_transferred} bytes)"
+    )
+    for warning in result.warnings:
+        print(f"Warning: {warning}", file=sys.stderr)
+    for name, stored_name in sorted(result.stored_as.items()):
+        print(f"  stored as: {name} -> {stored_name}")
+    for name, error in sorted(result.failed.items()):
+        print(f"  failed: {name}: {error}", file=sys.stderr)
+    return 1 if result.failed else 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="picture_cli",
+        description="Manage pictures on a Picture Management API server."
+    )
+    parser.add_argument(
+        "--url", default=os.environ.get("PICTURE_API_URL", "http://localhost:8000"),
+        help="server URL (env PICTURE_API_URL)"
+    )
+    parser.add_argument(
+        "--api-key", default=os.environ.get("PICTURE_API_KEY"),
+        help="API key sent as X-API-Key (env PICTURE_API_KEY)"
+    )
+    parser.add_argument("--retries", type=int, default=5, help="retries per request")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    command = commands.add_parser("list", help="list folders, or the pictures of one folder")
+    command.add_argument("folder", nargs="?")
+
+    command = commands.add_parser("get", help="download a picture")
+    command.add_argument("picture", type=_split_picture, help="folder/filename")
+    command.add_argument("-o", "--output", help="destination path (default: filename)")
+
+    command = commands.add_parser("post", help="upload pictures")
+    command.add_argument("files", nargs="+")
+    command.add_argument("-f", "--folder", help="destination folder (default: timestamp)")
+
+    command = commands.add_parser("put", help="replace a picture")
+    command.add_argument("picture", type=_split_picture, help="folder/filename")
+    command.add_argument("file")
+
+    command = commands.add_parser("delete", help="move a picture to the trash")
+    command.add_argument("picture", type=_split_picture, help="folder/filename")
+
+    command = commands.add_parser("delete-folder", help="move a folder to the trash")
+    command.add_argument("folder")
+
+    for name, help_text in (
+        ("push", "upload new and changed pictures from a local directory"),
+        ("pull", "download new and changed pictures into a local directory")
+    ):
+        command = commands.add_parser(name, help=help_text)
+        if name == "push":
+            command.add_argument("local_dir")
+            command.add_argument("folder")
+        else:
+            command.add_argument("folder")
+            command.add_argument("local_dir")
+        command.add_argument("-j", "--workers", type=int, default=8, help="parallel transfers")
+        command.add_argument(
+            "--checksum", action="store_true",
+            help="compare SHA-256 instead of mtime when sizes match"
+        )
+        command.add_argument("-n", "--dry-run", action="store_true")
+        command.add_argument("-v", "--verbose", action="store_true")
+
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    pool_size = max(getattr(args, "workers", 1), 1)
+
+    with PictureClient(args.url, api_key=args.api_key, pool_size=pool_size, retries=args.retries) as client:
+        try:
+            if args.command == "list":
+                _print_json(client.get_folder(args.folder) if args.folder else client.list_folders())
+            elif args.command == "get":
+                folder, filename = args.picture
+                output = args.output or filename
+                size = client.download(folder, filename, output)
+                print(f"Downloaded {folder}/{filename} to {output} ({size} bytes)")
+            elif args.command == "post":
+                missing = [path for path in args.files if not os.path.isfile(path)]
+                if missing:
+                    print(f"Error: File not found: {missing[0]}", file=sys.stderr)
+                    return 1
+                _print_json(client.upload(args.files, args.folder))
+            elif args.command == "put":
+                folder, filename = args.picture
+                _print_json(client.update(folder, filename, args.file))
+            elif args.command == "delete":
+                _print_json(client.delete(*args.picture))
+            elif args.command == "delete-folder":
+                _print_json(client.delete_folder(args.folder))
+            else:
+                progress = (lambda name: print(name)) if args.verbose else None
+                if args.command == "push":
+                    result = push(client, args.local_dir, args.folder, args.workers,
+                                  args.checksum, args.dry_run, progress)
+                else:
+                    result = pull(client, args.folder, args.local_dir, args.workers,
+                                  args.checksum, args.dry_run, progress)
+                return _report(result, args.dry_run)
+        except PictureAPIError as e:
+            print(f"Error: {e.detail} (HTTP {e.status_code})", file=sys.stderr)
+            return 1
+        except OSError as e:
+            print(f"Error: {e}", file=sys.stderr)
+            return 1
+    return 0
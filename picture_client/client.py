@@ -0,0 +1,200 @@
+"""HTTP client for the Picture Management API."""
+
+import os
+import time
+import random
+import contextlib
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import NewConnectionError
+
+# Statuses worth retrying: rate limited or temporarily unavailable
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+# Methods that can be repeated without creating anything twice
+IDEMPOTENT_METHODS = {"GET", "HEAD", "OPTIONS", "PUT", "DELETE"}
+
+
+def _not_sent(exc: Exception) -> bool:
+    """Check whether a request failed before reaching the server."""
+    if isinstance(exc, requests.ConnectTimeout):
+        return True
+    reason = getattr(exc.args[0], "reason", None) if exc.args else None
+    return isinstance(reason, NewConnectionError)
+
+
+class PictureAPIError(Exception):
+    """Raised when the API answers with an error status."""
+
+    def __init__(self, status_code: int, detail: str):
+        super().__init__(f"{status_code}: {detail}")
+        self.status_code = status_code
+        self.detail = detail
+
+
+class PictureClient:
+    """Client for the Picture Management API.
+
+    A single ``requests.Session`` keeps up to ``pool_size`` keep-alive
+    connections open, so the client can be shared by that many threads
+    without paying connection setup per request. Failed requests (connection
+    errors, 429 and 5xx answers) are retried with exponential backoff,
+    honouring ``Retry-After``. Uploads (``POST``) may already have been
+    stored when a 5xx or a broken connection is seen, so they are only
+    retried on 429 or when no connection could be made.
+    """
+
+    def __init__(
+        self,
+        base_url: str = "http://localhost:8000",
+        api_key: Optional[str] = None,
+        pool_size: int = 16,
+        retries: int = 5,
+        backoff: float = 0.5,
+        timeout: float = 60
+    ):
+        self.base_url = base_url.rstrip("/")
+        self.retries = retries
+        self.backoff = backoff
+        self.timeout = timeout
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        if api_key:
+            self.session.headers["X-API-Key"] = api_key
+
+    def close(self) -> None:
+        """Close all pooled connections."""
+        self.session.close()
+
+    def __enter__(self) -> "PictureClient":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def _url(self, *parts: str) -> str:
+        return "/".join([self.base_url] + [requests.utils.quote(part, safe="") for part in parts])
+
+    def _delay(self, attempt: int, response: Optional[requests.Response]) -> float:
+        """Seconds to wait before retry ``attempt`` (0-based)."""
+        if response is not None:
+            retry_after = response.headers.get("Retry-After", "")
+            if retry_after.isdigit():
+                return float(retry_after)
+        return self.backoff * (2 ** attempt) * (0.5 + random.random())
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        upload: Sequence[Tuple[str, str, str]] = (),
+        **kwargs: Any
+    ) -> requests.Response:
+        """Send a request, retrying transient failures.
+
+        ``upload`` lists ``(field, path, filename)`` files to send as
+        multipart form data; they are reopened for every attempt.
+        """
+        kwargs.setdefault("timeout", self.timeout)
+        idempotent = method.upper() in IDEMPOTENT_METHODS
+        retry_statuses = RETRY_STATUSES if idempotent else {429}
+
+        for attempt in range(self.retries + 1):
+            response = None
+            try:
+                with contextlib.ExitStack() as stack:
+                    if upload:
+                        kwargs["files"] = [
+                            (field, (filename, stack.enter_context(open(path, "rb"))))
+                            for field, path, filename in upload
+                        ]
+                    response = self.session.request(method, url, **kwargs)
+                if response.status_code not in retry_statuses:
+                    break
+            except (requests.ConnectionError, requests.Timeout) as e:
+                if attempt == self.retries or not (idempotent or _not_sent(e)):
+                    raise
+            if attempt < self.retries:
+                if response is not None:
+                    response.close()
+                time.sleep(self._delay(attempt, response))
+
+        if response.status_code >= 400:
+            try:
+                detail = response.json().get("detail", response.text)
+            except ValueError:
+                detail = response.text
+            raise PictureAPIError(response.status_code, str(detail))
+        return response
+
+    # Folders
+
+    def list_folders(self) -> Dict[str, Any]:
+        """List all folders and their pictures."""
+        return self.request("GET", self._url("folders")).json()["folders"]
+
+    def get_folder(self, folder: str) -> Dict[str, Any]:
+        """Get the pictures of a folder."""
+        return self.request("GET", self._url("folders", folder)).json()
+
+    def ingest_policy(self, folder: str) -> Optional[Dict[str, Any]]:
+        """Get the ingestion policy of a folder, or None if it has none."""
+        try:
+            return self.request("GET", self._url("folders", folder, "ingest-policy")).json()
+        except PictureAPIError as e:
+            if e.status_code == 404:
+                return None
+            raise
+
+    def delete_folder(self, folder: str) -> Dict[str, Any]:
+        """Move a folder to the trash."""
+        return self.request("DELETE", self._url("folders", folder)).json()
+
+    # Pictures
+
+    def picture_info(self, folder: str, filename: str, checksum: bool = False) -> Dict[str, Any]:
+        """Get information about a picture, optionally with its SHA-256."""
+        params = {"checksum": "true"} if checksum else None
+        return self.request("GET", self._url("pictures", folder, filename, "info"), params=params).json()
+
+    def download(self, folder: str, filename: str, dest_path: str) -> int:
+        """Download a picture to ``dest_path`` atomically; returns bytes written."""
+        response = self.request(
+            "GET", self._url("pictures", folder, filename),
+            params={"original": "true"}, stream=True
+        )
+        directory = os.path.dirname(os.path.abspath(dest_path))
+        tmp_path = os.path.join(directory, f".{os.path.basename(dest_path)}.part")
+
+        written = 0
+        try:
+            with open(tmp_path, "wb") as f:
+                for chunk in response.iter_content(chunk_size=1024 * 1024):
+                    f.write(chunk)
+                    written += len(chunk)
+            os.replace(tmp_path, dest_path)
+        finally:
+            response.close()
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+        return written
+
+    def upload(self, paths: List[str], folder: Optional[str] = None) -> Dict[str, Any]:
+        """Upload pictures into a folder (a timestamped one if omitted)."""
+        upload = [("files", path, os.path.basename(path)) for path in paths]
+        data = {"folder": folder} if folder else None
+        return self.request("POST", self._url("pictures"), upload=upload, data=data).json()
+
+    def update(self, folder: str, filename: str, path: str) -> Dict[str, Any]:
+        """Replace the content of an existing picture."""
+        upload = [("file", path, filename)]
+        return self.request("PUT", self._url("pictures", folder, filename), upload=upload).json()
+
+    def delete(self, folder: str, filename: str) -> Dict[str, Any]:
+        """Move a picture to the trash."""
+        return self.request("DELETE", self._url("pictures", folder, filename)).json()
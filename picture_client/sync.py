@@ -0,0 +1,299 @@
+"""Parallel folder synchronisation between a local directory and the API."""
+
+import os
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Tuple
+
+from .client import PictureAPIError, PictureClient
+
+# Mirrors the server's ALLOWED_EXTENSIONS
+IMAGE_EXTENSIONS = {'.png', '.jpg', '.jpeg', '.gif', '.bmp', '.webp', '.svg'}
+
+# Mirrors the server's INGEST_SOURCE_EXTENSIONS (rewritten by ingestion policies)
+INGEST_EXTENSIONS = {'.png', '.jpg', '.jpeg', '.bmp', '.webp'}
+
+# New pictures are pushed in multi-file uploads of at most this many files/bytes
+BATCH_FILES = 32
+BATCH_BYTES = 32 * 1024 * 1024
+
+# Transfer tasks are keyed by the names they transfer and return bytes sent
+Tasks = Dict[Tuple[str, ...], Callable[[], int]]
+
+
+@dataclass
+class SyncResult:
+    """Outcome of a push or pull.
+
+    ``stored_as`` maps pushed files to the name the server stored them
+    under, when that differs from the local name. ``warnings`` lists
+    limitations that applied to the run.
+    """
+    transferred: List[str] = field(default_factory=list)
+    skipped: List[str] = field(default_factory=list)
+    failed: Dict[str, str] = field(default_factory=dict)
+    bytes_transferred: int = 0
+    stored_as: Dict[str, str] = field(default_factory=dict)
+    warnings: List[str] = field(default_factory=list)
+
+
+def file_checksum(path: str) -> str:
+    """Compute the SHA-256 hex digest of a local file."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _local_pictures(local_dir: str) -> Dict[str, os.stat_result]:
+    """Stat the pictures directly inside ``local_dir``."""
+    pictures = {}
+    with os.scandir(local_dir) as entries:
+        for entry in entries:
+            _, ext = os.path.splitext(entry.name.lower())
+            if entry.is_file() and ext in IMAGE_EXTENSIONS and not entry.name.startswith("."):
+                pictures[entry.name] = entry.stat()
+    return pictures
+
+
+def _remote_pictures(client: PictureClient, folder: str) -> Dict[str, dict]:
+    """List a remote folder, treating a missing folder as empty."""
+    try:
+        return {p["filename"]: p for p in client.get_folder(folder)["pictures"]}
+    except PictureAPIError as e:
+        if e.status_code == 404:
+            return {}
+        raise
+
+
+def _ingested_name(name: str, policy: Optional[dict]) -> Optional[str]:
+    """Return the name the server stores a file under after ingestion.
+
+    Returns None when the folder's policy does not rewrite the file
+    (mirrors the server's ``IngestionService.target_filename``).
+    """
+    base, ext = os.path.splitext(name)
+    if policy is None or ext.lower() not in INGEST_EXTENSIONS:
+        return None
+    if ext.lower() == ".bmp" and policy.get("convert_bmp_to"):
+        return f"{base}.{policy['convert_bmp_to']}"
+    return name
+
+
+def _unchanged(
+    client: PictureClient,
+    folder: str,
+    name: str,
+    local_path: str,
+    local: os.stat_result,
+    remote: dict,
+    checksum: bool,
+    newer_side: str
+) -> bool:
+    """Decide whether a file can be skipped.
+
+    Sizes must match. Then either the checksums are compared, or the file
+    counts as changed when the ``newer_side`` copy has a later mtime.
+    """
+    if local.st_size != remote["size"]:
+        return False
+    if checksum:
+        return client.picture_info(folder, name, checksum=True)["sha256"] == file_checksum(local_path)
+    if remote.get("mtime") is None:
+        return True
+    if newer_side == "local":
+        return local.st_mtime <= remote["mtime"]
+    return remote["mtime"] <= local.st_mtime
+
+
+def _run(tasks: Tasks, workers: int, result: SyncResult) -> None:
+    """Run transfer tasks in parallel, collecting results."""
+    def run_one(names: Tuple[str, ...]):
+        try:
+            return names, tasks[names](), None
+        except Exception as e:
+            return names, 0, str(e)
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for names, size, error in executor.map(run_one, sorted(tasks)):
+            if error is None:
+                result.transferred.extend(names)
+                result.bytes_transferred += size
+            else:
+                for name in names:
+                    result.failed[name] = error
+
+
+def _batches(names: List[str], sizes: Dict[str, int]) -> List[Tuple[str, ...]]:
+    """Group names into batches bounded by ``BATCH_FILES`` and ``BATCH_BYTES``."""
+    batches: List[Tuple[str, ...]] = []
+    batch: List[str] = []
+    batch_bytes = 0
+    for name in names:
+        if batch and (len(batch) >= BATCH_FILES or batch_bytes + sizes[name] > BATCH_BYTES):
+            batches.append(tuple(batch))
+            batch, batch_bytes = [], 0
+        batch.append(name)
+        batch_bytes += sizes[name]
+    if batch:
+        batches.append(tuple(batch))
+    return batches
+
+
+def push(
+    client: PictureClient,
+    local_dir: str,
+    folder: str,
+    workers: int = 8,
+    checksum: bool = False,
+    dry_run: bool = False,
+    progress: Optional[Callable[[str], None]] = None
+) -> SyncResult:
+    """Upload new and changed pictures from ``local_dir`` to ``folder``.
+
+    Changed pictures are replaced one by one; new ones are uploaded in
+    batches of several files per request.
+
+    When the folder has an ingestion policy, the pictures it rewrites are
+    looked up under their converted name and only uploaded if missing:
+    their processed size cannot be compared with the local file, and
+    replacing them would store the raw bytes without applying the policy.
+    """
+    local = _local_pictures(local_dir)
+    remote = _remote_pictures(client, folder)
+    policy = client.ingest_policy(folder)
+    result = SyncResult()
+    if policy is not None:
+        result.warnings.append(
+            f"{folder} has an ingestion policy: processed pictures are only "
+            "uploaded when missing, changes to existing ones are not pushed"
+        )
+
+    def update(name: str) -> int:
+        client.update(folder, name, os.path.join(local_dir, name))
+        return local[name].st_size
+
+    def upload(names: Tuple[str, ...]) -> int:
+        response = client.upload([os.path.join(local_dir, name) for name in names], folder)
+        stored = response.get("files", [])
+        if len(stored) == len(names):
+            for name, stored_name in zip(names, stored):
+                if stored_name != name:
+                    result.stored_as[name] = stored_name
+        return sum(local[name].st_size for name in names)
+
+    def check(name: str) -> bool:
+        ingested = _ingested_name(name, policy)
+        if ingested is not None:
+            return ingested not in remote
+        path = os.path.join(local_dir, name)
+        return name not in remote or not _unchanged(
+            client, folder, name, path, local[name], remote[name], checksum, "local"
+        )
+
+    def plan(names: List[str]) -> Tasks:
+        # Pictures rewritten by the policy only reach here when missing remotely
+        new = [name for name in names if name not in remote or _ingested_name(name, policy)]
+        tasks: Tasks = {(name,): (lambda name=name: update(name)) for name in names if name not in new}
+        sizes = {name: local[name].st_size for name in new}
+        for batch in _batches(new, sizes):
+            tasks[batch] = lambda batch=batch: upload(batch)
+        return tasks
+
+    _sync(local, check, plan, workers, dry_run, progress, result)
+    return result
+
+
+def pull(
+    client: PictureClient,
+    folder: str,
+    local_dir: str,
+    workers: int = 8,
+    checksum: bool = False,
+    dry_run: bool = False,
+    progress: Optional[Callable[[str], None]] = None
+) -> SyncResult:
+    """Download new and changed pictures from ``folder`` into ``local_dir``.
+
+    Downloaded files get the remote mtime, so the next pull skips them.
+    """
+    os.makedirs(local_dir, exist_ok=True)
+    local = _local_pictures(local_dir)
+    remote = _remote_pictures(client, folder)
+    result = SyncResult()
+
+    def download(name: str) -> int:
+        path = os.path.join(local_dir, name)
+        size = client.download(folder, name, path)
+        mtime = remote[name].get("mtime")
+        if mtime is not None:
+            os.utime(path, (mtime, mtime))
+        return size
+
+    def check(name: str) -> bool:
+        path = os.path.join(local_dir, name)
+        return name not in local or not _unchanged(
+            client, folder, name, path, local[name], remote[name], checksum, "remote"
+        )
+
+    def plan(names: List[str]) -> Tasks:
+        return {(name,): (lambda name=name: download(name)) for name in names}
+
+    _sync(remote, check, plan, workers, dry_run, progress, result)
+    return result
+
+
+def _sync(
+    names,
+    check: Callable[[str], bool],
+    plan: Callable[[List[str]], Tasks],
+    workers: int,
+    dry_run: bool,
+    progress: Optional[Callable[[str], None]],
+    result: SyncResult
+) -> None:
+    """Check every name in parallel, then transfer the changed ones.
+
+    ``check`` tells whether a name needs transferring and ``plan`` turns
+    the names to transfer into tasks.
+    """
+    def checked(name: str):
+        try:
+            return name, check(name), None
+        except Exception as e:
+            return name, False, str(e)
+
+    changed = []
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for name, transfer, error in executor.map(checked, sorted(names)):
+            if error is not None:
+                result.failed[name] = error
+            elif not transfer:
+                result.skipped.append(name)
+            else:
+                changed.append(name)
+
+    if dry_run:
+        result.transferred.extend(changed)
+        return
+
+    tasks = plan(changed)
+    if progress is not None:
+        tasks = {names: _reporting(names, task, progress) for names, task in tasks.items()}
+    _run(tasks, workers, result)
+
+
+def _reporting(
+    names: Tuple[str, ...],
+    task: Callable[[], int],
+    progress: Callable[[str], None]
+) -> Callable[[], int]:
+    """Wrap a task so ``progress`` is called for its names once it succeeds."""
+    def run() -> int:
+        size = task()
+        for name in names:
+            progress(name)
+        return size
+    return run
@@ -0,0 +1,112 @@
+"""Production entry point for the Picture Management API.
+
+Runs several pre-forked worker processes. With gunicorn installed
+(``pip install gunicorn uvicorn-worker``) the application is imported once
+in the master and forked into the workers (``--preload``), so new workers
+start almost instantly; send ``SIGHUP`` to the master to gracefully replace
+all workers. Without gunicorn, uvicorn's own multi-process supervisor is
+used, which also restarts workers gracefully on ``SIGHUP``.
+
+Usage:
+    python serve.py --workers 4 --port 8000
+
+Settings can also be given as environment variables (``PICTURE_WORKERS``,
+``PICTURE_HOST``, ``PICTURE_PORT``, ``PICTURE_UPLOAD_DIR`` ...).
+"""
+
+import os
+import argparse
+import importlib.util
+
+APP = "main:app"
+
+
+def parse_args() -> argparse.Namespace:
+    """Parse command-line options, defaulting to environment variables."""
+    parser = argparse.ArgumentParser(description="Serve the Picture Management API")
+    parser.add_argument("--host", default=os.environ.get("PICTURE_HOST", "0.0.0.0"))
+    parser.add_argument("--port", type=int, default=int(os.environ.get("PICTURE_PORT", "8000")))
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=int(os.environ.get("PICTURE_WORKERS", str(os.cpu_count() or 1))),
+        help="number of worker processes"
+    )
+    parser.add_argument(
+        "--preload",
+        action=argparse.BooleanOptionalAction,
+        default=os.environ.get("PICTURE_PRELOAD", "1") == "1",
+        help="import the app once before forking workers (gunicorn only; "
+             "disable to reload code on SIGHUP)"
+    )
+    parser.add_argument(
+        "--graceful-timeout",
+        type=int,
+        default=int(os.environ.get("PICTURE_GRACEFUL_TIMEOUT", "30")),
+        help="seconds workers get to finish requests on reload or shutdown"
+    )
+    parser.add_argument("--upload-dir", default=os.environ.get("PICTURE_UPLOAD_DIR"))
+    return parser.parse_args()
+
+
+def configure_environment(args: argparse.Namespace) -> None:
+    """Export settings read by the application at import time."""
+    if args.upload_dir:
+        os.environ["PICTURE_UPLOAD_DIR"] = args.upload_dir
+
+    # Workers must share rate limit state to enforce per-client limits
+    if args.workers > 1 and not os.environ.get("PICTURE_RATE_LIMIT_STORE"):
+        upload_dir = os.environ.get("PICTURE_UPLOAD_DIR", "uploads")
+        os.makedirs(upload_dir, exist_ok=True)
+        os.environ["PICTURE_RATE_LIMIT_STORE"] = os.path.join(upload_dir, ".rate_limit.db")
+
+
+def serve_gunicorn(args: argparse.Namespace) -> None:
+    """Run pre-forked workers under gunicorn."""
+    from gunicorn.app.base import BaseApplication
+
+    if importlib.util.find_spec("uvicorn_worker"):
+        worker_class = "uvicorn_worker.UvicornWorker"
+    else:
+        worker_class = "uvicorn.workers.UvicornWorker"
+
+    class Application(BaseApplication):
+        def load_config(self):
+            self.cfg.set("bind", f"{args.host}:{args.port}")
+            self.cfg.set("workers", args.workers)
+            self.cfg.set("worker_class", worker_class)
+            self.cfg.set("preload_app", args.preload)
+            self.cfg.set("graceful_timeout", args.graceful_timeout)
+
+        def load(self):
+            from main import app
+            return app
+
+    Application().run()
+
+
+def serve_uvicorn(args: argparse.Namespace) -> None:
+    """Run workers under uvicorn's multi-process supervisor."""
+    import uvicorn
+
+    uvicorn.run(
+        APP,
+        host=args.host,
+        port=args.port,
+        workers=args.workers,
+        timeout_graceful_shutdown=args.graceful_timeout
+    )
+
+
+def main() -> None:
+    args = parse_args()
+    configure_environment(args)
+
+    if os.name == "posix" and importlib.util.find_spec("gunicorn"):
+        serve_gunicorn(args)
+    else:
+        serve_uvicorn(args)
+
+
+if __name__ == "__main__":
+    main()
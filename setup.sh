@@ -24,7 +24,7 @@ echo "✅ pip found"
 # Install required packages
 echo "📦 Installing required Python packages..."
 
-pip install fastapi uvicorn python-multipart || pip3 install fastapi uvicorn python-multipart
+pip install fastapi uvicorn python-multipart requests || pip3 install fastapi uvicorn python-multipart requests
 
 if [ $? -eq 0 ]; then
     echo "✅ Python packages installed successfully"